@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .balldontlie_nba_connector import BallDontLieNBAConnector
 from .bwf_world_championships_history_connector import BwfWorldChampionshipsHistoryConnector
 from .bwf_thomas_uber_cup_history_connector import BwfThomasUberCupHistoryConnector
@@ -80,9 +82,15 @@ CONNECTOR_REGISTRY = {
 }
 
 
+@lru_cache(maxsize=32)
+def _connector_instance(key: str):
+    # Connectors hold no per-run state, so one instance per process is shared by every caller.
+    return CONNECTOR_REGISTRY[key]()
+
+
 def build_connector(connector_name: str):
     key = connector_name.strip().lower()
     if key not in CONNECTOR_REGISTRY:
         available = ", ".join(sorted(CONNECTOR_REGISTRY))
         raise ValueError(f"Unknown connector '{connector_name}'. Available: {available}")
-    return CONNECTOR_REGISTRY[key]()
+    return _connector_instance(key)
@@ -2,20 +2,48 @@ from __future__ import annotations
 
 import re
 import shutil
+import sqlite3
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
 from src.core.db import SQLiteDB
-from src.core.utils import slugify, utc_now_iso
+from src.core.utils import slugify, slugify_series, utc_now_iso
 
 from .base import Connector
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pv
+except ImportError:
+    pa = None
+    pc = None
+    pv = None
+
+DTYPE_BACKEND = "pyarrow" if pa is not None else "numpy_nullable"
+TEXT_DTYPE = "string[pyarrow]" if pa is not None else "string"
+
 
 SEED_FILE = "world_athletics_championships_top3_seed.csv"
 RANK_TO_MEDAL = {1: "gold", 2: "silver", 3: "bronze"}
 RANK_TO_POINTS = {1: 3.0, 2: 2.0, 3: 1.0}
+VALID_GENDERS = frozenset({"men", "women", "mixed"})
+VALID_PARTICIPANT_TYPES = frozenset({"athlete", "team"})
+VALID_MEDALS = frozenset({"gold", "silver", "bronze"})
+# "performance" is not read through the typed backends at all: score_raw embeds it as pd.read_csv's default
+# inference renders it ("11.0" for whole numbers next to blanks, "10.2" for "10.20"), see _read_seed_frame.
+TEXT_COLUMNS = (
+    "gender",
+    "discipline_name",
+    "medal",
+    "participant_type",
+    "athlete_name",
+    "country_name",
+    "country_code",
+)
 ATHLETICS_DISCIPLINE_CANONICAL: dict[str, str] = {
     "10-000-m": "10,000 m",
     "10-000-metres": "10,000 m",
@@ -61,6 +89,61 @@ ATHLETICS_DISCIPLINE_CANONICAL: dict[str, str] = {
 }
 
 
+def _normalize_text(series: pd.Series, case: str | None = None) -> pd.Series:
+    values = series.astype(TEXT_DTYPE).fillna("")
+    if pc is None:
+        values = values.str.strip()
+        if case == "lower":
+            return values.str.lower()
+        if case == "upper":
+            return values.str.upper()
+        return values
+
+    array = pc.utf8_trim_whitespace(pa.array(values))
+    if case == "lower":
+        array = pc.utf8_lower(array)
+    elif case == "upper":
+        array = pc.utf8_upper(array)
+    return pd.Series(pd.arrays.ArrowStringArray(array), index=series.index, name=series.name)
+
+
+def _read_seed_frame(seed_path: Path) -> pd.DataFrame:
+    if pv is None:
+        frame = pd.read_csv(seed_path, dtype_backend=DTYPE_BACKEND)
+    else:
+        table = pv.read_csv(
+            seed_path,
+            convert_options=pv.ConvertOptions(
+                column_types={column: pa.string() for column in TEXT_COLUMNS},
+                strings_can_be_null=True,
+            ),
+        )
+        frame = table.to_pandas(types_mapper=pd.ArrowDtype)
+    if "performance" in frame.columns:
+        # Arrow and the nullable backend infer e.g. int64 for whole numbers with blanks where the default reader gives
+        # float64, which would turn "11.0" into "11" in score_raw; take this one column from the default reader.
+        frame["performance"] = pd.read_csv(seed_path, usecols=["performance"])["performance"]
+    return frame
+
+
+@lru_cache(maxsize=None)
+def _clean_person_name_for_id(name: str) -> str:
+    normalized = re.sub(r"\s+", "_", str(name).strip())
+    normalized = re.sub(r"[^0-9A-Za-zÀ-ÖØ-öø-ÿ_-]", "", normalized)
+    return normalized or slugify(str(name))
+
+
+@lru_cache(maxsize=None)
+def _discipline_id(discipline_name: str) -> str:
+    return f"athletics_{slugify(discipline_name)}"
+
+
+def _dedupe_results(results_df: pd.DataFrame) -> pd.DataFrame:
+    return results_df.sort_values(["event_id", "participant_id", "rank"]).drop_duplicates(
+        subset=["event_id", "participant_id"], keep="first"
+    )
+
+
 class WorldAthleticsChampionshipsHistoryConnector(Connector):
     id = "world_athletics_championships_history"
     name = "World Athletics Championships Historical Podiums (Top 3 by Discipline)"
@@ -104,12 +187,6 @@ class WorldAthleticsChampionshipsHistoryConnector(Connector):
         )
         return [out_file]
 
-    @staticmethod
-    def _clean_person_name_for_id(name: str) -> str:
-        normalized = re.sub(r"\s+", "_", str(name).strip())
-        normalized = re.sub(r"[^0-9A-Za-zÀ-ÖØ-öø-ÿ_-]", "", normalized)
-        return normalized or slugify(str(name))
-
     @staticmethod
     def _name_signatures(name: str) -> set[str]:
         cleaned = re.sub(r"[^0-9A-Za-zÀ-ÖØ-öø-ÿ]+", " ", str(name).upper()).strip()
@@ -122,12 +199,13 @@ class WorldAthleticsChampionshipsHistoryConnector(Connector):
         return signatures
 
     @staticmethod
-    def _discipline_id(discipline_name: str) -> str:
-        return f"athletics_{slugify(discipline_name)}"
+    def _country_by_alpha3(country_code: str) -> Any:
+        try:
+            import pycountry
 
-    @staticmethod
-    def _event_id(year: int, gender: str, discipline_name: str) -> str:
-        return f"world_athletics_championships_{year}_{slugify(gender)}_{slugify(discipline_name)}"
+            return pycountry.countries.get(alpha_3=country_code)
+        except Exception:
+            return None
 
     @staticmethod
     def _canonical_discipline_name(discipline_name: str) -> str:
@@ -142,7 +220,7 @@ class WorldAthleticsChampionshipsHistoryConnector(Connector):
         if seed_path is None:
             raise RuntimeError(f"Missing {SEED_FILE} in fetched paths.")
 
-        frame = pd.read_csv(seed_path)
+        frame = _read_seed_frame(seed_path)
         required_cols = {
             "year",
             "event_date",
@@ -161,34 +239,35 @@ class WorldAthleticsChampionshipsHistoryConnector(Connector):
                 f"Unsupported World Athletics seed format for {seed_path.name}: {list(frame.columns)}"
             )
 
-        frame = frame.copy()
-        frame["year"] = pd.to_numeric(frame["year"], errors="coerce")
-        frame["rank"] = pd.to_numeric(frame["rank"], errors="coerce")
+        frame["year"] = pd.to_numeric(frame["year"], errors="coerce", dtype_backend=DTYPE_BACKEND)
+        frame["rank"] = pd.to_numeric(frame["rank"], errors="coerce", dtype_backend=DTYPE_BACKEND)
         frame["event_date"] = pd.to_datetime(frame["event_date"], errors="coerce")
-        frame["gender"] = frame["gender"].fillna("").astype(str).str.strip().str.lower()
-        frame["discipline_name"] = frame["discipline_name"].fillna("").astype(str).str.strip()
-        frame["medal"] = frame["medal"].fillna("").astype(str).str.strip().str.lower()
-        frame["participant_type"] = frame["participant_type"].fillna("").astype(str).str.strip().str.lower()
-        frame["athlete_name"] = frame["athlete_name"].fillna("").astype(str).str.strip()
-        frame["country_name"] = frame["country_name"].fillna("").astype(str).str.strip()
-        frame["country_code"] = frame["country_code"].fillna("").astype(str).str.strip().str.upper()
-        frame["performance"] = frame["performance"].fillna("").astype(str).str.strip()
+        frame["gender"] = _normalize_text(frame["gender"], case="lower")
+        frame["discipline_name"] = _normalize_text(frame["discipline_name"])
+        frame["medal"] = _normalize_text(frame["medal"], case="lower")
+        frame["participant_type"] = _normalize_text(frame["participant_type"], case="lower")
+        frame["athlete_name"] = _normalize_text(frame["athlete_name"])
+        frame["country_name"] = _normalize_text(frame["country_name"])
+        frame["country_code"] = _normalize_text(frame["country_code"], case="upper")
+        frame["performance"] = _normalize_text(frame["performance"].fillna("").astype(str))
         frame["discipline_name"] = frame["discipline_name"].map(self._canonical_discipline_name)
 
         frame = frame.dropna(subset=["year", "rank", "event_date"])
         frame["year"] = frame["year"].astype(int)
         frame["rank"] = frame["rank"].astype(int)
         frame["event_date"] = frame["event_date"].dt.strftime("%Y-%m-%d")
-        frame = frame.loc[(frame["year"] <= season_year) & (frame["rank"] >= 1) & (frame["rank"] <= 3)].copy()
-        frame = frame.loc[
-            frame["gender"].isin(["men", "women", "mixed"])
-            & frame["participant_type"].isin(["athlete", "team"])
-            & (frame["discipline_name"] != "")
-            & (frame["country_code"] != "")
-        ].copy()
-        frame = frame.loc[~((frame["participant_type"] == "athlete") & (frame["athlete_name"] == ""))].copy()
+        mask = (
+            (frame["year"] <= season_year)
+            & frame["rank"].between(1, 3)
+            & frame["gender"].isin(VALID_GENDERS)
+            & frame["participant_type"].isin(VALID_PARTICIPANT_TYPES)
+            & frame["discipline_name"].ne("")
+            & frame["country_code"].ne("")
+            & ~(frame["participant_type"].eq("athlete") & frame["athlete_name"].eq(""))
+        )
+        frame = frame.loc[mask].reset_index(drop=True)
         frame["medal"] = frame.apply(
-            lambda row: row["medal"] if row["medal"] in {"gold", "silver", "bronze"} else RANK_TO_MEDAL[row["rank"]],
+            lambda row: row["medal"] if row["medal"] in VALID_MEDALS else RANK_TO_MEDAL[row["rank"]],
             axis=1,
         )
         frame = frame.drop_duplicates(
@@ -213,20 +292,19 @@ class WorldAthleticsChampionshipsHistoryConnector(Connector):
             ]
         )
 
-        disciplines_rows: list[dict[str, Any]] = []
-        for discipline_name in sorted(frame["discipline_name"].unique()):
-            discipline_id = self._discipline_id(discipline_name)
-            disciplines_rows.append(
-                {
-                    "discipline_id": discipline_id,
-                    "discipline_name": discipline_name,
-                    "discipline_slug": slugify(discipline_name),
-                    "sport_id": sport_id,
-                    "confidence": 1.0,
-                    "mapping_source": "connector_world_athletics_championships_history",
-                    "created_at_utc": timestamp,
-                }
-            )
+        discipline_names = frame["discipline_name"].drop_duplicates().sort_values(ignore_index=True)
+        discipline_slugs = slugify_series(discipline_names)
+        disciplines_df = pd.DataFrame(
+            {
+                "discipline_id": "athletics_" + discipline_slugs,
+                "discipline_name": discipline_names,
+                "discipline_slug": discipline_slugs,
+                "sport_id": sport_id,
+                "confidence": 1.0,
+                "mapping_source": "connector_world_athletics_championships_history",
+                "created_at_utc": timestamp,
+            }
+        )
 
         competition_id = "world_athletics_championships"
         competitions_df = pd.DataFrame(
@@ -244,103 +322,94 @@ class WorldAthleticsChampionshipsHistoryConnector(Connector):
             ]
         )
 
-        events_rows: list[dict[str, Any]] = []
-        for year, gender, discipline_name, event_date in (
-            frame[["year", "gender", "discipline_name", "event_date"]]
-            .drop_duplicates()
-            .sort_values(["year", "gender", "discipline_name"])
-            .itertuples(index=False)
-        ):
-            events_rows.append(
-                {
-                    "event_id": self._event_id(int(year), str(gender), str(discipline_name)),
-                    "competition_id": competition_id,
-                    "discipline_id": self._discipline_id(str(discipline_name)),
-                    "gender": str(gender),
-                    "event_class": "podium_top3_by_discipline",
-                    "event_date": str(event_date),
-                }
-            )
+        event_ids = (
+            "world_athletics_championships_"
+            + frame["year"].astype(str)
+            + "_"
+            + slugify_series(frame["gender"])
+            + "_"
+            + slugify_series(frame["discipline_name"])
+        )
 
-        participants_rows: dict[str, dict[str, Any]] = {}
-        countries_rows: dict[str, dict[str, Any]] = {}
-        results_rows: list[dict[str, Any]] = []
-
-        for row in frame.itertuples(index=False):
-            country_code = str(row.country_code).upper()
-            country_name = str(row.country_name).strip() or country_code
-            participant_type = str(row.participant_type)
-
-            if participant_type == "team":
-                participant_id = country_code
-                display_name = country_name
-            else:
-                athlete_name = str(row.athlete_name).strip()
-                participant_id = f"athlete_{self._clean_person_name_for_id(athlete_name)}_{country_code}"
-                display_name = athlete_name
-
-            participants_rows[participant_id] = {
-                "participant_id": participant_id,
-                "type": participant_type,
-                "display_name": display_name,
-                "country_id": country_code,
+        events_df = pd.DataFrame(
+            {
+                "event_id": event_ids,
+                "competition_id": competition_id,
+                "discipline_id": frame["discipline_name"].map(_discipline_id),
+                "gender": frame["gender"],
+                "event_class": "podium_top3_by_discipline",
+                "event_date": frame["event_date"],
             }
+        ).drop_duplicates(subset=["event_id"])
 
-            if country_code not in countries_rows:
-                country_obj = None
-                try:
-                    import pycountry
-
-                    country_obj = pycountry.countries.get(alpha_3=country_code)
-                except Exception:
-                    country_obj = None
-                countries_rows[country_code] = {
-                    "country_id": country_code,
-                    "iso2": getattr(country_obj, "alpha_2", None) if country_obj else None,
-                    "iso3": country_code,
-                    "name_en": getattr(country_obj, "name", country_name) if country_obj else country_name,
-                    "name_fr": None,
-                }
-
-            rank = int(row.rank)
-            medal = str(row.medal)
-            event_id = self._event_id(int(row.year), str(row.gender), str(row.discipline_name))
-            score_raw = f"discipline={row.discipline_name};performance={row.performance};country={country_code}"
-            results_rows.append(
+        is_team = frame["participant_type"].eq("team")
+        country_label = frame["country_name"].where(frame["country_name"].ne(""), frame["country_code"])
+        athlete_ids = (
+            "athlete_" + frame["athlete_name"].map(_clean_person_name_for_id) + "_" + frame["country_code"]
+        )
+        participant_ids = frame["country_code"].where(is_team, athlete_ids)
+        # Participants keep their first-seen order but the values of their last row, as the former keyed dict did.
+        latest_participants = (
+            pd.DataFrame(
                 {
-                    "event_id": event_id,
-                    "participant_id": participant_id,
-                    "rank": rank,
-                    "medal": medal,
-                    "score_raw": score_raw,
-                    "points_awarded": RANK_TO_POINTS.get(rank),
+                    "participant_id": participant_ids,
+                    "type": frame["participant_type"],
+                    "display_name": country_label.where(is_team, frame["athlete_name"]),
+                    "country_id": frame["country_code"],
                 }
             )
+            .drop_duplicates(subset=["participant_id"], keep="last")
+            .set_index("participant_id")
+        )
+        participants_df = latest_participants.loc[participant_ids.drop_duplicates()].reset_index()
 
-        results_df = pd.DataFrame(results_rows)
-        if not results_df.empty:
-            rank_sort = pd.to_numeric(results_df["rank"], errors="coerce").fillna(10**9)
-            results_df = (
-                results_df.assign(_rank_sort=rank_sort)
-                .sort_values(["event_id", "participant_id", "_rank_sort"])
-                .drop_duplicates(subset=["event_id", "participant_id"], keep="first")
-                .drop(columns=["_rank_sort"])
-            )
+        countries_df = pd.DataFrame({"country_id": frame["country_code"], "name_en": country_label}).drop_duplicates(
+            subset=["country_id"]
+        )
+        country_objs = countries_df["country_id"].map(self._country_by_alpha3)
+        countries_df = countries_df.assign(
+            iso2=country_objs.map(lambda country_obj: getattr(country_obj, "alpha_2", None)),
+            iso3=countries_df["country_id"],
+            name_en=[
+                getattr(country_obj, "name", name_en) if country_obj else name_en
+                for country_obj, name_en in zip(country_objs, countries_df["name_en"])
+            ],
+            name_fr=None,
+        )[["country_id", "iso2", "iso3", "name_en", "name_fr"]]
+
+        results_df = pd.DataFrame(
+            {
+                "event_id": event_ids,
+                "participant_id": participant_ids,
+                "rank": frame["rank"],
+                "medal": frame["medal"],
+                "score_raw": (
+                    "discipline="
+                    + frame["discipline_name"]
+                    + ";performance="
+                    + frame["performance"]
+                    + ";country="
+                    + frame["country_code"]
+                ),
+                "points_awarded": frame["rank"].map(RANK_TO_POINTS),
+            }
+        )
+        results_df = _dedupe_results(results_df)
 
         return {
-            "countries": pd.DataFrame(countries_rows.values()).drop_duplicates(subset=["country_id"]),
+            "countries": countries_df,
             "sports": sports_df,
-            "disciplines": pd.DataFrame(disciplines_rows).drop_duplicates(subset=["discipline_id"]),
+            "disciplines": disciplines_df.drop_duplicates(subset=["discipline_id"]),
             "competitions": competitions_df,
-            "events": pd.DataFrame(events_rows).drop_duplicates(subset=["event_id"]),
-            "participants": pd.DataFrame(participants_rows.values()).drop_duplicates(subset=["participant_id"]),
+            "events": events_df,
+            "participants": participants_df,
             "results": results_df,
             "sport_federations": pd.DataFrame(),
         }
 
     def _reuse_existing_athletes(
         self,
-        db: SQLiteDB,
+        conn: sqlite3.Connection,
         participants_df: pd.DataFrame,
         results_df: pd.DataFrame,
     ) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -348,15 +417,14 @@ class WorldAthleticsChampionshipsHistoryConnector(Connector):
             return participants_df, results_df
 
         athlete_mask = participants_df["type"] == "athlete"
-        incoming_athletes = participants_df.loc[athlete_mask].copy()
+        incoming_athletes = participants_df.loc[athlete_mask]
         if incoming_athletes.empty:
             return participants_df, results_df
 
-        with db.connect() as conn:
-            existing_athletes = pd.read_sql_query(
-                "SELECT participant_id, display_name, country_id FROM participants WHERE type = 'athlete'",
-                conn,
-            )
+        existing_athletes = pd.read_sql_query(
+            "SELECT participant_id, display_name, country_id FROM participants WHERE type = 'athlete'",
+            conn,
+        )
 
         lookup: dict[tuple[str, str], str] = {}
         for row in existing_athletes.sort_values("participant_id").itertuples(index=False):
@@ -384,64 +452,53 @@ class WorldAthleticsChampionshipsHistoryConnector(Connector):
         if not replacement:
             return participants_df, results_df
 
-        remapped_results = results_df.copy()
-        remapped_results["participant_id"] = remapped_results["participant_id"].map(lambda pid: replacement.get(pid, pid))
-        rank_sort = pd.to_numeric(remapped_results["rank"], errors="coerce").fillna(10**9)
-        remapped_results = (
-            remapped_results.assign(_rank_sort=rank_sort)
-            .sort_values(["event_id", "participant_id", "_rank_sort"])
-            .drop_duplicates(subset=["event_id", "participant_id"], keep="first")
-            .drop(columns=["_rank_sort"])
+        remapped_results = _dedupe_results(
+            results_df.assign(participant_id=results_df["participant_id"].map(lambda pid: replacement.get(pid, pid)))
         )
 
-        filtered_participants = participants_df.loc[~participants_df["participant_id"].isin(replacement.keys())].copy()
+        filtered_participants = participants_df.loc[~participants_df["participant_id"].isin(replacement.keys())]
         return filtered_participants, remapped_results
 
-    def _normalize_athletics_discipline_ids(self, db: SQLiteDB) -> None:
-        with db.connect() as conn:
-            conn.execute(
-                """
-                UPDATE events
-                SET discipline_id = (
-                    SELECT d_pref.discipline_id
-                    FROM disciplines d_pref
-                    WHERE d_pref.discipline_id LIKE 'athletics_%'
-                      AND d_pref.discipline_name = (
-                          SELECT d_legacy.discipline_name
-                          FROM disciplines d_legacy
-                          WHERE d_legacy.discipline_id = events.discipline_id
-                      )
-                )
-                WHERE discipline_id IN (
-                    SELECT d_legacy.discipline_id
-                    FROM disciplines d_pref
-                    JOIN disciplines d_legacy
-                      ON d_pref.discipline_name = d_legacy.discipline_name
-                    WHERE d_pref.discipline_id LIKE 'athletics_%'
-                      AND d_legacy.discipline_id = REPLACE(d_pref.discipline_id, 'athletics_', '')
-                )
-                """
-            )
-            conn.execute(
-                """
-                DELETE FROM disciplines
-                WHERE discipline_id IN (
-                    SELECT d_legacy.discipline_id
-                    FROM disciplines d_pref
-                    JOIN disciplines d_legacy
-                      ON d_pref.discipline_name = d_legacy.discipline_name
-                    WHERE d_pref.discipline_id LIKE 'athletics_%'
-                      AND d_legacy.discipline_id = REPLACE(d_pref.discipline_id, 'athletics_', '')
-                )
-                  AND discipline_id NOT IN (
-                      SELECT DISTINCT discipline_id FROM events WHERE discipline_id IS NOT NULL
-                  )
-                """
+    def _normalize_athletics_discipline_ids(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DROP TABLE IF EXISTS temp._athletics_discipline_remap")
+        conn.execute(
+            """
+            CREATE TEMP TABLE _athletics_discipline_remap AS
+            SELECT d_legacy.discipline_id AS legacy_id, d_pref.discipline_id AS preferred_id
+            FROM disciplines d_pref
+            JOIN disciplines d_legacy
+              ON d_pref.discipline_name = d_legacy.discipline_name
+            WHERE d_pref.discipline_id LIKE 'athletics_%'
+              AND d_legacy.discipline_id = REPLACE(d_pref.discipline_id, 'athletics_', '')
+            """
+        )
+        conn.execute(
+            "CREATE INDEX temp._athletics_discipline_remap_legacy ON _athletics_discipline_remap(legacy_id)"
+        )
+        conn.execute(
+            """
+            UPDATE events
+            SET discipline_id = (
+                SELECT remap.preferred_id
+                FROM _athletics_discipline_remap remap
+                WHERE remap.legacy_id = events.discipline_id
             )
-            conn.commit()
+            WHERE discipline_id IN (SELECT legacy_id FROM _athletics_discipline_remap)
+            """
+        )
+        conn.execute(
+            """
+            DELETE FROM disciplines
+            WHERE discipline_id IN (SELECT legacy_id FROM _athletics_discipline_remap)
+              AND discipline_id NOT IN (
+                  SELECT discipline_id FROM events WHERE discipline_id IS NOT NULL
+              )
+            """
+        )
+        conn.execute("DROP TABLE temp._athletics_discipline_remap")
 
     def upsert(self, db: SQLiteDB, payload: dict[str, pd.DataFrame]) -> None:
-        with db.connect() as conn:
+        with db.transaction() as conn:
             conn.execute(
                 """
                 DELETE FROM results
@@ -468,22 +525,29 @@ class WorldAthleticsChampionshipsHistoryConnector(Connector):
             conn.execute(
                 """
                 DELETE FROM participants
-                WHERE participant_id NOT IN (SELECT DISTINCT participant_id FROM results)
-                  AND (type = 'athlete' OR type = 'team')
+                WHERE type IN ('athlete', 'team')
+                  AND NOT EXISTS (
+                      SELECT 1 FROM results r WHERE r.participant_id = participants.participant_id
+                  )
                 """
             )
-            conn.commit()
-
-        participants_df = payload.get("participants", pd.DataFrame()).copy()
-        results_df = payload.get("results", pd.DataFrame()).copy()
-        participants_df, results_df = self._reuse_existing_athletes(db, participants_df, results_df)
-        payload = {**payload, "participants": participants_df, "results": results_df}
-
-        db.upsert_dataframe("countries", payload.get("countries", pd.DataFrame()), ["country_id"])
-        db.upsert_dataframe("sports", payload.get("sports", pd.DataFrame()), ["sport_id"])
-        db.upsert_dataframe("disciplines", payload.get("disciplines", pd.DataFrame()), ["discipline_id"])
-        db.upsert_dataframe("competitions", payload.get("competitions", pd.DataFrame()), ["competition_id"])
-        db.upsert_dataframe("events", payload.get("events", pd.DataFrame()), ["event_id"])
-        self._normalize_athletics_discipline_ids(db)
-        db.upsert_dataframe("participants", payload.get("participants", pd.DataFrame()), ["participant_id"])
-        db.upsert_dataframe("results", payload.get("results", pd.DataFrame()), ["event_id", "participant_id"])
+
+            participants_df = payload.get("participants", pd.DataFrame())
+            results_df = payload.get("results", pd.DataFrame())
+            participants_df, results_df = self._reuse_existing_athletes(conn, participants_df, results_df)
+            payload = {**payload, "participants": participants_df, "results": results_df}
+
+            db.upsert_dataframe("countries", payload.get("countries", pd.DataFrame()), ["country_id"], conn=conn)
+            db.upsert_dataframe("sports", payload.get("sports", pd.DataFrame()), ["sport_id"], conn=conn)
+            db.upsert_dataframe("disciplines", payload.get("disciplines", pd.DataFrame()), ["discipline_id"], conn=conn)
+            db.upsert_dataframe(
+                "competitions", payload.get("competitions", pd.DataFrame()), ["competition_id"], conn=conn
+            )
+            db.upsert_dataframe("events", payload.get("events", pd.DataFrame()), ["event_id"], conn=conn)
+            self._normalize_athletics_discipline_ids(conn)
+            db.upsert_dataframe(
+                "participants", payload.get("participants", pd.DataFrame()), ["participant_id"], conn=conn
+            )
+            db.upsert_dataframe(
+                "results", payload.get("results", pd.DataFrame()), ["event_id", "participant_id"], conn=conn
+            )
@@ -2,18 +2,33 @@ from __future__ import annotations
 
 import re
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.core.db import SQLiteDB
-from src.core.utils import slugify, utc_now_iso
+from src.core.utils import replace_file_bytes, safe_mkdir, slugify, utc_now_iso
 
 from .base import Connector
 
+try:
+    import pycountry
+except ImportError:
+    pycountry = None
+
 
 OPENFOOTBALL_RAW_BASE = "https://raw.githubusercontent.com/openfootball/world-cup/master"
+FETCH_USER_AGENT = "DataSportPipeline/0.1 (World Cup history fetch)"
+FETCH_WORKERS = 8
+FETCH_CACHE_DIR = Path.home() / ".cache" / "datasport" / "world_cup"
+FETCH_CACHE_TTL_SECONDS = 30 * 24 * 3600
 
 WORLD_CUP_FOLDERS = [
     (1930, "1930--uruguay"),
@@ -61,6 +76,11 @@ COUNTRY_OVERRIDES = {
     "Turkey": "TUR",
 }
 
+SPORT_ID = slugify("Football")
+DISCIPLINE_ID = slugify("FIFA World Cup Final Ranking")
+RANK_TO_MEDAL = {1: "gold", 2: "silver", 3: "bronze"}
+RANK_TO_POINTS = {1: 10.0, 2: 7.0, 3: 5.0, 4: 4.0}
+
 SPECIAL_TOP4 = {
     1930: [("Uruguay", 1), ("Argentina", 2), ("United States", 3), ("Yugoslavia", 4)],
     1950: [("Uruguay", 1), ("Brazil", 2), ("Sweden", 3), ("Spain", 4)],
@@ -93,6 +113,59 @@ MONTHS = {
     "december": 12,
 }
 
+CUP_FILE_PATTERN = re.compile(r"cup_(\d{4})\.txt")
+SCORE_PATTERN = re.compile(r"(\d+)\s*-\s*(\d+)")
+COLUMN_GAP_PATTERN = re.compile(r"\s{2,}")
+# One anchored pass over "(n) meta  team1  s1-s2  tail  team2  @ venue": each team is the last gap-free column on its
+# side of the first score. Characters before the score are tempered so that no earlier score can hide inside them.
+NO_SCORE_CHAR = r"(?:(?!\d+\s*-\s*\d)[^@])"
+NO_SCORE_WORD_CHAR = r"(?:(?!\d+\s*-\s*\d)[^@\s])"
+MATCH_LINE_PATTERN = re.compile(
+    rf"^\s*(?:{NO_SCORE_CHAR}*?\s{{2,}})??(?P<team1>{NO_SCORE_WORD_CHAR}+(?:\s{NO_SCORE_WORD_CHAR}+)*)\s*"
+    r"(?P<score1>\d+)\s*-\s*(?P<score2>\d+)\s*"
+    r"(?:[^@]*?\s{2,})??(?P<team2>[^@\s]+(?:\s[^@\s]+)*)\s*(?:@.*)?$"
+)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# Only match rows and lines mentioning a final/third-place heading can change the section state.
+SECTION_LINE_PATTERN = re.compile(r"^[^\S\n]*(?:\(.*|.*(?:final|third|3rd).*)$", re.IGNORECASE | re.MULTILINE)
+HEADING_CLEAN_PATTERN = re.compile(r"^#+\s*|\s+#.*$|##.*$")
+LEADING_MATCH_NUMBER_PATTERN = re.compile(r"^\(\d+\)\s*")
+# Month tokens are matched as plain words and validated against MONTHS instead of a name alternation.
+LEADING_DAY_MONTH_PATTERN = re.compile(r"^\d{1,2}\s+(?P<month>[a-z]+)\s+", re.IGNORECASE)
+LEADING_MONTH_DAY_PATTERN = re.compile(r"^(?P<month>[a-z]+)\s+\d{1,2}\s+", re.IGNORECASE)
+LEADING_MONTH_SLASH_DAY_PATTERN = re.compile(r"^(?P<month>[a-z]+)/\d{1,2}\s+", re.IGNORECASE)
+TEAM_NOISE_PATTERN = re.compile(
+    r"\([^)]*\)|a\.?\s*e\.?\s*t\.?|pen(?:s|alties)?\.?|\b(?:agg\.?|after extra time|after penalties|won|win)\b",
+    re.IGNORECASE,
+)
+TRAILING_TEAM_NAME_PATTERN = re.compile(r"([A-Za-z][A-Za-z .'\-]*[A-Za-z])$")
+SLASH_DATE_PATTERN = re.compile(r"([a-z]+)/(\d{1,2})")
+DAY_MONTH_PATTERN = re.compile(r"\b(\d{1,2})\s+([a-z]+)\b")
+
+
+@lru_cache(maxsize=512)
+def _pycountry_by_alpha3(country_code: str) -> Any:
+    if pycountry is None:
+        return None
+    try:
+        return pycountry.countries.get(alpha_3=country_code)
+    except LookupError:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _resolve_country_code(country_name: str) -> str:
+    if country_name in COUNTRY_OVERRIDES:
+        return COUNTRY_OVERRIDES[country_name]
+    if pycountry is not None:
+        try:
+            code = getattr(pycountry.countries.lookup(country_name), "alpha_3", None)
+        except LookupError:
+            code = None
+        if code:
+            return code
+    return slugify(country_name)[:3].upper()
+
 
 class WorldCupHistoryConnector(Connector):
     id = "world_cup_history"
@@ -116,6 +189,78 @@ class WorldCupHistoryConnector(Connector):
     def _local_seed_path(self) -> Path:
         return Path(__file__).resolve().parents[2] / "data" / "raw" / "world_cup" / "world_cup_top4_seed.csv"
 
+    @staticmethod
+    def _build_session() -> requests.Session:
+        session = requests.Session()
+        session.headers.update({"User-Agent": FETCH_USER_AGENT})
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=FETCH_WORKERS,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def _is_usable_cup_text(self, year: int, text: str, season_year: int) -> bool:
+        if not text.strip():
+            return False
+        # The in-progress edition may not have a final yet; finished ones must still yield their top 4.
+        if year >= season_year or year in SPECIAL_TOP4:
+            return True
+        top4, _ = self._extract_top4_from_cup_text(year, text)
+        return bool(top4)
+
+    def _cached_cup_file(self, year: int, season_year: int) -> bytes | None:
+        cache_path = FETCH_CACHE_DIR / f"cup_{year}.txt"
+        try:
+            stat = cache_path.stat()
+        except OSError:
+            return None
+        if stat.st_size == 0:
+            return None
+        # Past tournaments are immutable; only the in-progress edition expires.
+        if year >= season_year and time.time() - stat.st_mtime > FETCH_CACHE_TTL_SECONDS:
+            return None
+        try:
+            content = cache_path.read_bytes()
+            if not self._is_usable_cup_text(year, content.decode("utf-8"), season_year):
+                return None
+        except (OSError, UnicodeDecodeError):
+            return None
+        return content
+
+    def _fetch_one(
+        self, session: requests.Session, year: int, folder_name: str, out_dir: Path, season_year: int
+    ) -> tuple[int, Path] | None:
+        target = out_dir / f"cup_{year}.txt"
+        cached = self._cached_cup_file(year, season_year)
+        if cached is not None:
+            target.write_bytes(cached)
+            return year, target
+
+        chosen_content: str | None = None
+        try:
+            for candidate in ("cup_finals.txt", "cup.txt"):
+                url = f"{OPENFOOTBALL_RAW_BASE}/{folder_name}/{candidate}"
+                response = session.get(url, timeout=60)
+                if response.status_code == 200 and response.text.strip():
+                    chosen_content = response.text
+                    break
+        except Exception:
+            chosen_content = None
+
+        if not chosen_content:
+            return None
+        content = chosen_content.encode("utf-8")
+        target.write_bytes(content)
+        if self._is_usable_cup_text(year, chosen_content, season_year):
+            try:
+                # Written to a temp file and renamed, so an interrupted run never leaves a truncated cache entry.
+                replace_file_bytes(safe_mkdir(FETCH_CACHE_DIR) / target.name, content)
+            except OSError:
+                pass
+        return year, target
+
     def fetch(self, season_year: int, out_dir: Path) -> list[Path]:
         local_seed = self._local_seed_path()
         if local_seed.exists():
@@ -124,31 +269,17 @@ class WorldCupHistoryConnector(Connector):
             self._write_json(out_dir / "fetch_meta.json", {"mode": "local_seed", "source": str(local_seed)})
             return [out_file]
 
-        raw_paths: list[Path] = []
-        downloaded_years: list[int] = []
-        for year, folder_name in WORLD_CUP_FOLDERS:
-            if year > season_year:
-                continue
-            chosen_content: str | None = None
-            try:
-                import requests
-
-                headers = {"User-Agent": "DataSportPipeline/0.1 (World Cup history fetch)"}
-                for candidate in ("cup_finals.txt", "cup.txt"):
-                    url = f"{OPENFOOTBALL_RAW_BASE}/{folder_name}/{candidate}"
-                    response = requests.get(url, headers=headers, timeout=60)
-                    if response.status_code == 200 and response.text.strip():
-                        chosen_content = response.text
-                        break
-            except Exception:
-                chosen_content = None
-
-            if chosen_content:
-                target = out_dir / f"cup_{year}.txt"
-                target.write_text(chosen_content, encoding="utf-8")
-                raw_paths.append(target)
-                downloaded_years.append(year)
+        with self._build_session() as session, ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            futures = [
+                executor.submit(self._fetch_one, session, year, folder_name, out_dir, season_year)
+                for year, folder_name in WORLD_CUP_FOLDERS
+                if year <= season_year
+            ]
+            results = [future.result() for future in as_completed(futures)]
 
+        fetched = sorted(result for result in results if result)
+        downloaded_years = [year for year, _ in fetched]
+        raw_paths = [target for _, target in fetched]
         if not raw_paths:
             raise RuntimeError("No World Cup source files could be downloaded.")
 
@@ -166,22 +297,25 @@ class WorldCupHistoryConnector(Connector):
     def _parse_match_line(line: str) -> tuple[str, str, int, int] | None:
         if not line.strip().startswith("("):
             return None
-        no_venue = line.split("@", 1)[0]
-        score_match = re.search(r"(\d+)\s*-\s*(\d+)", no_venue)
-        if not score_match:
-            return None
-        score1 = int(score_match.group(1))
-        score2 = int(score_match.group(2))
-
-        before = no_venue[: score_match.start()].strip()
-        after = no_venue[score_match.end() :].strip()
-        team1_parts = [part.strip() for part in re.split(r"\s{2,}", before) if part.strip()]
-        team2_parts = [part.strip() for part in re.split(r"\s{2,}", after) if part.strip()]
-        if not team1_parts or not team2_parts:
-            return None
-        team1_candidate = WorldCupHistoryConnector._strip_leading_match_metadata(team1_parts[-1])
+        match = MATCH_LINE_PATTERN.match(line)
+        if match:
+            score1, score2 = int(match.group("score1")), int(match.group("score2"))
+            team1_column, team2_column = match.group("team1"), match.group("team2")
+        else:
+            no_venue = line.partition("@")[0]
+            score_match = SCORE_PATTERN.search(no_venue)
+            if not score_match:
+                return None
+            score1, score2 = int(score_match.group(1)), int(score_match.group(2))
+
+            # Both sides are stripped, so the last column-gap chunk is already trimmed and empty only when the side is.
+            team1_column = COLUMN_GAP_PATTERN.split(no_venue[: score_match.start()].strip())[-1]
+            team2_column = COLUMN_GAP_PATTERN.split(no_venue[score_match.end() :].strip())[-1]
+            if not team1_column or not team2_column:
+                return None
+        team1_candidate = WorldCupHistoryConnector._strip_leading_match_metadata(team1_column)
         team1 = WorldCupHistoryConnector._extract_team_name(team1_candidate)
-        team2 = WorldCupHistoryConnector._extract_team_name(team2_parts[-1])
+        team2 = WorldCupHistoryConnector._extract_team_name(team2_column)
         if not team1 or not team2:
             return None
         return team1, team2, score1, score2
@@ -189,25 +323,18 @@ class WorldCupHistoryConnector(Connector):
     @staticmethod
     def _strip_leading_match_metadata(text: str) -> str:
         cleaned = str(text).strip()
-        cleaned = re.sub(r"^\(\d+\)\s*", "", cleaned)
-        month_pattern = (
-            r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|"
-            r"jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
-        )
-        cleaned = re.sub(rf"^\d{{1,2}}\s+{month_pattern}\s+", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(rf"^{month_pattern}\s+\d{{1,2}}\s+", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(rf"^{month_pattern}/\d{{1,2}}\s+", "", cleaned, flags=re.IGNORECASE)
+        cleaned = LEADING_MATCH_NUMBER_PATTERN.sub("", cleaned)
+        for pattern in (LEADING_DAY_MONTH_PATTERN, LEADING_MONTH_DAY_PATTERN, LEADING_MONTH_SLASH_DAY_PATTERN):
+            match = pattern.match(cleaned)
+            if match and match.group("month").lower() in MONTHS:
+                cleaned = cleaned[match.end() :]
         return cleaned.strip()
 
     @staticmethod
     def _extract_team_name(text: str) -> str | None:
-        cleaned = str(text)
-        cleaned = re.sub(r"\([^)]*\)", " ", cleaned)
-        cleaned = re.sub(r"a\.?\s*e\.?\s*t\.?", " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"pen(?:s|alties)?\.?", " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\b(agg\.?|after extra time|after penalties|won|win)\b", " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-        match = re.search(r"([A-Za-z][A-Za-z .'\-]*[A-Za-z])$", cleaned)
+        cleaned = TEAM_NOISE_PATTERN.sub(" ", str(text))
+        cleaned = WHITESPACE_PATTERN.sub(" ", cleaned).strip()
+        match = TRAILING_TEAM_NAME_PATTERN.search(cleaned)
         if not match:
             return None
         return match.group(1).strip()
@@ -217,58 +344,42 @@ class WorldCupHistoryConnector(Connector):
         if not final_line:
             return f"{year}-12-31"
         line = final_line.lower()
-        slash_pattern = re.search(r"(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*/(\d{1,2})", line)
-        if slash_pattern:
-            month = MONTHS[slash_pattern.group(1)]
-            day = int(slash_pattern.group(2))
-            return f"{year}-{month:02d}-{day:02d}"
-        day_month_pattern = re.search(
-            r"\b(\d{1,2})\s+("
-            r"january|february|march|april|may|june|july|august|september|october|november|december|"
-            r"jan|feb|mar|apr|jun|jul|aug|sep|sept|oct|nov|dec"
-            r")\b",
-            line,
-        )
-        if day_month_pattern:
-            day = int(day_month_pattern.group(1))
-            month = MONTHS[day_month_pattern.group(2)]
-            return f"{year}-{month:02d}-{day:02d}"
+        for slash_match in SLASH_DATE_PATTERN.finditer(line):
+            month = MONTHS.get(slash_match.group(1)[:3])
+            if month:
+                return f"{year}-{month:02d}-{int(slash_match.group(2)):02d}"
+        for day_month_match in DAY_MONTH_PATTERN.finditer(line):
+            month = MONTHS.get(day_month_match.group(2))
+            if month:
+                return f"{year}-{month:02d}-{int(day_month_match.group(1)):02d}"
         return f"{year}-12-31"
 
-    def _resolve_country_code(self, country_name: str) -> str:
-        if country_name in COUNTRY_OVERRIDES:
-            return COUNTRY_OVERRIDES[country_name]
-        try:
-            import pycountry
-
-            country = pycountry.countries.lookup(country_name)
-            code = getattr(country, "alpha_3", None)
-            if code:
-                return code
-        except Exception:
-            pass
-        return slugify(country_name)[:3].upper()
-
     def _extract_top4_from_cup_text(self, year: int, text: str) -> tuple[list[tuple[str, int]], str]:
         if year in SPECIAL_TOP4:
             return SPECIAL_TOP4[year], f"{year}-12-31"
 
-        lines = text.splitlines()
         final_line: str | None = None
         third_line: str | None = None
         in_final = False
         in_third = False
-        for line in lines:
-            stripped = line.strip()
-            lowered = stripped.lower()
-            heading = re.sub(r"\s+", " ", lowered).strip()
-            heading = re.sub(r"^#+\s*", "", heading).strip()
-            heading = heading.split("##", 1)[0].strip()
-            heading = heading.split(" #", 1)[0].strip()
-            heading_norm = heading.replace("-", " ")
+        for section_match in SECTION_LINE_PATTERN.finditer(text):
+            stripped = section_match.group().strip()
+            # Match rows never double as headings, so skip heading normalisation for them.
+            if stripped.startswith("("):
+                if in_final and not final_line:
+                    final_line = stripped
+                    in_final = False
+                elif in_third and not third_line:
+                    third_line = stripped
+                    in_third = False
+                if final_line and third_line:
+                    break
+                continue
+
+            heading_norm = " ".join(HEADING_CLEAN_PATTERN.sub("", stripped).lower().split()).replace("-", " ")
 
             # Skip schedule/header rows like "Final | Sun Dec/18".
-            if "|" in heading:
+            if "|" in heading_norm:
                 continue
 
             if heading_norm == "final":
@@ -281,16 +392,6 @@ class WorldCupHistoryConnector(Connector):
             if is_third_heading:
                 in_third = True
                 in_final = False
-                continue
-            if stripped.startswith("("):
-                if in_final and not final_line:
-                    final_line = stripped
-                    in_final = False
-                    continue
-                if in_third and not third_line:
-                    third_line = stripped
-                    in_third = False
-                    continue
 
         if not final_line:
             return [], f"{year}-12-31"
@@ -319,17 +420,18 @@ class WorldCupHistoryConnector(Connector):
         del season_year
         seed_csv = next((path for path in raw_paths if path.suffix.lower() == ".csv"), None)
         if seed_csv:
-            seed = pd.read_csv(seed_csv)
-            annual_rows = seed.to_dict(orient="records")
+            annual_df = pd.read_csv(seed_csv)
         else:
             annual_rows: list[dict[str, Any]] = []
             for path in sorted(raw_paths):
-                match = re.match(r"cup_(\d{4})\.txt", path.name)
+                match = CUP_FILE_PATTERN.match(path.name)
                 if not match:
                     continue
                 year = int(match.group(1))
-                text = path.read_text(encoding="utf-8")
-                top4, event_date = self._extract_top4_from_cup_text(year, text)
+                if year in SPECIAL_TOP4:
+                    top4, event_date = SPECIAL_TOP4[year], f"{year}-12-31"
+                else:
+                    top4, event_date = self._extract_top4_from_cup_text(year, path.read_text(encoding="utf-8"))
                 for country_name, rank in top4:
                     annual_rows.append(
                         {
@@ -339,15 +441,17 @@ class WorldCupHistoryConnector(Connector):
                             "event_date": event_date,
                         }
                     )
+            annual_df = pd.DataFrame(annual_rows)
 
-        annual_df = pd.DataFrame(annual_rows)
-        annual_df = annual_df.drop_duplicates(subset=["year", "rank", "country_name"])
-        annual_df = annual_df.sort_values(["year", "rank", "country_name"]).reset_index(drop=True)
-        annual_df = annual_df.loc[annual_df["rank"] <= 4].copy()
+        annual_df = (
+            annual_df.loc[annual_df["rank"] <= 4]
+            .drop_duplicates(subset=["year", "rank", "country_name"])
+            .sort_values(["year", "rank", "country_name"], ignore_index=True)
+        )
 
         timestamp = utc_now_iso()
-        sport_id = slugify("Football")
-        discipline_id = slugify("FIFA World Cup Final Ranking")
+        sport_id = SPORT_ID
+        discipline_id = DISCIPLINE_ID
         competition_id = "fifa_world_cup"
 
         sports_df = pd.DataFrame(
@@ -391,106 +495,114 @@ class WorldCupHistoryConnector(Connector):
             ]
         )
 
-        events_rows: list[dict[str, Any]] = []
-        participants_rows: dict[str, dict[str, Any]] = {}
-        countries_rows: dict[str, dict[str, Any]] = {}
-        results_rows: list[dict[str, Any]] = []
+        annual_df["rank"] = annual_df["rank"].astype(int)
+        # Team names and ids repeat across editions, so keep them as categoricals (int8 codes) downstream.
+        annual_df["country_name"] = annual_df["country_name"].astype(str).str.strip().astype("category")
+        country_codes = {name: _resolve_country_code(name) for name in annual_df["country_name"].cat.categories}
+        annual_df["country_id"] = annual_df["country_name"].map(country_codes).astype("category")
+        annual_df["event_id"] = ("fifa_world_cup_" + annual_df["year"].astype(int).astype(str).str[-2:]).astype(
+            "category"
+        )
 
-        for year, group in annual_df.groupby("year", sort=True):
-            event_id = f"fifa_world_cup_{str(int(year))[-2:]}"
-            event_date = group["event_date"].iloc[0]
-            events_rows.append(
-                {
-                    "event_id": event_id,
-                    "competition_id": competition_id,
-                    "discipline_id": discipline_id,
-                    "gender": "men",
-                    "event_class": "final_ranking_top4",
-                    "event_date": event_date,
-                }
+        events_df = (
+            annual_df.drop_duplicates(subset=["event_id"])[["event_id", "event_date"]]
+            .assign(
+                competition_id=competition_id,
+                discipline_id=discipline_id,
+                gender="men",
+                event_class="final_ranking_top4",
             )
-            for _, row in group.sort_values("rank").iterrows():
-                country_name = str(row["country_name"]).strip()
-                country_id = self._resolve_country_code(country_name)
-                participant_id = country_id
-                participants_rows[participant_id] = {
-                    "participant_id": participant_id,
-                    "type": "team",
-                    "display_name": country_name,
-                    "country_id": country_id,
-                }
+            .reset_index(drop=True)
+        )
+        events_df = events_df[["event_id", "competition_id", "discipline_id", "gender", "event_class", "event_date"]]
 
-                if country_id not in countries_rows:
-                    try:
-                        import pycountry
-
-                        country = pycountry.countries.get(alpha_3=country_id)
-                    except Exception:
-                        country = None
-                    countries_rows[country_id] = {
-                        "country_id": country_id,
-                        "iso2": getattr(country, "alpha_2", None) if country else None,
-                        "iso3": country_id,
-                        "name_en": getattr(country, "name", country_name) if country else country_name,
-                        "name_fr": None,
-                    }
-
-                rank = int(row["rank"])
-                points = {1: 10.0, 2: 7.0, 3: 5.0, 4: 4.0}.get(rank, None)
-                medal = "gold" if rank == 1 else "silver" if rank == 2 else "bronze" if rank == 3 else None
-                results_rows.append(
-                    {
-                        "event_id": event_id,
-                        "participant_id": participant_id,
-                        "rank": rank,
-                        "medal": medal,
-                        "score_raw": f"world_cup_final_rank={rank}",
-                        "points_awarded": points,
-                    }
-                )
+        first_seen = annual_df.drop_duplicates(subset=["country_id"]).reset_index(drop=True)
+        # Participants keep their first-seen order but the latest display name, as the former keyed dict did.
+        latest_names = dict(zip(annual_df["country_id"], annual_df["country_name"]))
+        participants_df = pd.DataFrame(
+            {
+                "participant_id": first_seen["country_id"],
+                "type": "team",
+                "display_name": [latest_names[country_id] for country_id in first_seen["country_id"]],
+                "country_id": first_seen["country_id"],
+            }
+        )
+
+        lookups = [_pycountry_by_alpha3(country_id) for country_id in first_seen["country_id"]]
+        countries_df = pd.DataFrame(
+            {
+                "country_id": first_seen["country_id"],
+                "iso2": [getattr(country, "alpha_2", None) if country else None for country in lookups],
+                "iso3": first_seen["country_id"],
+                "name_en": [
+                    getattr(country, "name", name) if country else name
+                    for country, name in zip(lookups, first_seen["country_name"])
+                ],
+                "name_fr": None,
+            }
+        )
+
+        medal = annual_df["rank"].map(RANK_TO_MEDAL)
+        results_df = pd.DataFrame(
+            {
+                "event_id": annual_df["event_id"],
+                "participant_id": annual_df["country_id"],
+                "rank": annual_df["rank"],
+                "medal": medal.astype(object).where(medal.notna(), None),
+                "score_raw": "world_cup_final_rank=" + annual_df["rank"].astype(str),
+                "points_awarded": annual_df["rank"].map(RANK_TO_POINTS),
+            }
+        )
 
         return {
-            "countries": pd.DataFrame(countries_rows.values()).drop_duplicates(subset=["country_id"]),
+            "countries": countries_df,
             "sports": sports_df,
             "disciplines": disciplines_df,
             "competitions": competitions_df,
-            "events": pd.DataFrame(events_rows).drop_duplicates(subset=["event_id"]),
-            "participants": pd.DataFrame(participants_rows.values()).drop_duplicates(subset=["participant_id"]),
-            "results": pd.DataFrame(results_rows).drop_duplicates(subset=["event_id", "participant_id"]),
+            "events": events_df,
+            "participants": participants_df,
+            "results": results_df.drop_duplicates(subset=["event_id", "participant_id"]).reset_index(drop=True),
             "sport_federations": pd.DataFrame(),
         }
 
     def upsert(self, db: SQLiteDB, payload: dict[str, pd.DataFrame]) -> None:
-        with db.connect() as conn:
+        with db.transaction() as conn:
+            conn.execute("DROP TABLE IF EXISTS temp._world_cup_competitions")
             conn.execute(
                 """
-                DELETE FROM results
-                WHERE event_id IN (
-                    SELECT e.event_id
-                    FROM events e
-                    JOIN competitions c ON c.competition_id = e.competition_id
-                    WHERE c.source_id = ?
-                )
+                CREATE TEMP TABLE _world_cup_competitions AS
+                SELECT competition_id FROM competitions WHERE source_id = ?
                 """,
                 (self.id,),
             )
             conn.execute(
                 """
-                DELETE FROM events
-                WHERE competition_id IN (
-                    SELECT competition_id FROM competitions WHERE source_id = ?
+                DELETE FROM results
+                WHERE event_id IN (
+                    SELECT event_id FROM events
+                    WHERE competition_id IN (SELECT competition_id FROM _world_cup_competitions)
                 )
-                """,
-                (self.id,),
+                """
+            )
+            conn.execute(
+                "DELETE FROM events WHERE competition_id IN (SELECT competition_id FROM _world_cup_competitions)"
+            )
+            conn.execute(
+                "DELETE FROM competitions WHERE competition_id IN (SELECT competition_id FROM _world_cup_competitions)"
             )
-            conn.execute("DELETE FROM competitions WHERE source_id = ?", (self.id,))
             conn.execute("DELETE FROM disciplines WHERE mapping_source = 'connector_world_cup_history'")
-            conn.commit()
-
-        db.upsert_dataframe("countries", payload.get("countries", pd.DataFrame()), ["country_id"])
-        db.upsert_dataframe("sports", payload.get("sports", pd.DataFrame()), ["sport_id"])
-        db.upsert_dataframe("disciplines", payload.get("disciplines", pd.DataFrame()), ["discipline_id"])
-        db.upsert_dataframe("competitions", payload.get("competitions", pd.DataFrame()), ["competition_id"])
-        db.upsert_dataframe("events", payload.get("events", pd.DataFrame()), ["event_id"])
-        db.upsert_dataframe("participants", payload.get("participants", pd.DataFrame()), ["participant_id"])
-        db.upsert_dataframe("results", payload.get("results", pd.DataFrame()), ["event_id", "participant_id"])
+            conn.execute("DROP TABLE temp._world_cup_competitions")
+
+            db.upsert_dataframe("countries", payload.get("countries", pd.DataFrame()), ["country_id"], conn=conn)
+            db.upsert_dataframe("sports", payload.get("sports", pd.DataFrame()), ["sport_id"], conn=conn)
+            db.upsert_dataframe("disciplines", payload.get("disciplines", pd.DataFrame()), ["discipline_id"], conn=conn)
+            db.upsert_dataframe(
+                "competitions", payload.get("competitions", pd.DataFrame()), ["competition_id"], conn=conn
+            )
+            db.upsert_dataframe("events", payload.get("events", pd.DataFrame()), ["event_id"], conn=conn)
+            db.upsert_dataframe(
+                "participants", payload.get("participants", pd.DataFrame()), ["participant_id"], conn=conn
+            )
+            db.upsert_dataframe(
+                "results", payload.get("results", pd.DataFrame()), ["event_id", "participant_id"], conn=conn
+            )
@@ -1,18 +1,45 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.core.db import SQLiteDB
-from src.core.utils import slugify, utc_now_iso
+from src.core.utils import safe_mkdir, slugify, utc_now_iso
 
 from .base import Connector
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pycountry
+except ImportError:
+    pycountry = None
+
+try:
+    import pyarrow
+    import pyarrow.csv as pyarrow_csv
+    import pyarrow.parquet as pyarrow_parquet
+except ImportError:
+    pyarrow = None
+    pyarrow_csv = None
+    pyarrow_parquet = None
+
+TEXT_DTYPE = "string[pyarrow]" if pyarrow is not None else "string"
+
 
 API_BASE = "https://api.wr-rims-prod.pulselive.com/rugby/v3/rankings"
 LEGACY_MEN_CSV_URL = "https://raw.githubusercontent.com/dfhampshire/irb_rank_scraper/master/rankings.csv"
@@ -20,7 +47,32 @@ SPORTS = {
     "mru": {"gender": "men", "label": "World Rugby Men's Rankings"},
     "wru": {"gender": "women", "label": "World Rugby Women's Rankings"},
 }
-DEFAULT_START_YEAR = 1990
+# Rankings were first published in October 2003; earlier years only return 404s or a later effective date.
+EARLIEST_YEAR = {"mru": 2003, "wru": 2003}
+SPORT_ID = slugify("Rugby")
+DISCIPLINE_ID = "rugby-union"
+FETCH_USER_AGENT = "DataSportPipeline/0.1 (World Rugby rankings fetch)"
+FETCH_WORKERS = 16
+
+PARSE_CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "world_rugby_rankings"
+# Bump whenever _parse_rankings or its normalisation changes, so payloads cached by older code are not served.
+PARSE_CACHE_VERSION = 2
+PAYLOAD_TABLES = (
+    "countries",
+    "sports",
+    "disciplines",
+    "competitions",
+    "events",
+    "participants",
+    "results",
+    "sport_federations",
+)
+
+RANK_TO_MEDAL = {1: "gold", 2: "silver", 3: "bronze"}
+RANKING_COLUMNS = ["sport", "requested_year", "effective_date", "country_name", "country_code", "source_rank", "points"]
+RANKING_KEY_COLUMNS = ["sport", "requested_year", "effective_date", "country_name"]
+PARTICIPANT_COLUMNS = ["participant_id", "type", "display_name", "country_id"]
+COUNTRY_COLUMNS = ["country_id", "iso2", "iso3", "name_en", "name_fr"]
 
 COUNTRY_ALIASES = {
     "ENG": "ENG",
@@ -38,6 +90,42 @@ COUNTRY_NAME_ALIASES = {
     "Hong Kong": "HKG",
 }
 
+# Same field priority as pycountry.countries.lookup, which checks its indices in this order.
+PYCOUNTRY_LOOKUP_FIELDS = ("alpha_2", "alpha_3", "flag", "name", "numeric", "official_name", "common_name")
+
+
+@lru_cache(maxsize=1)
+def _pycountry_name_index() -> dict[str, str]:
+    index: dict[str, str] = {}
+    if pycountry is None:
+        return index
+    for field in PYCOUNTRY_LOOKUP_FIELDS:
+        for country in pycountry.countries:
+            value = getattr(country, field, None)
+            if value and hasattr(country, "alpha_3"):
+                index.setdefault(str(value).lower(), country.alpha_3)
+    return index
+
+
+@lru_cache(maxsize=4096)
+def _resolve_country_code_cached(country_name: str, country_code: str, known_codes: frozenset[str]) -> str:
+    name_alias_code = COUNTRY_NAME_ALIASES.get(str(country_name or "").strip())
+    if name_alias_code:
+        return name_alias_code
+
+    code = str(country_code or "").strip().upper()
+    if len(code) == 3 and code in known_codes:
+        return code
+
+    alias_code = COUNTRY_ALIASES.get(code)
+    if alias_code:
+        return alias_code
+
+    candidate = _pycountry_name_index().get(str(country_name).lower())
+    if candidate:
+        return candidate
+    return code if len(code) == 3 else slugify(country_name)[:3].upper()
+
 
 class WorldRugbyRankingHistoryConnector(Connector):
     id = "world_rugby_ranking_history"
@@ -52,25 +140,134 @@ class WorldRugbyRankingHistoryConnector(Connector):
     def _local_seed_path(self) -> Path:
         return Path(__file__).resolve().parents[2] / "data" / "raw" / "world_rugby" / "world_rugby_rankings_history.csv"
 
+    def _fetch_state_path(self) -> Path:
+        return self._local_seed_path().with_name("fetch_state.json")
+
+    def _start_years(self) -> dict[str, int]:
+        stored: dict[str, Any] = {}
+        state_path = self._fetch_state_path()
+        if state_path.exists():
+            try:
+                stored = json.loads(state_path.read_text(encoding="utf-8")).get("earliest_years", {})
+            except (OSError, ValueError):
+                stored = {}
+        start_years: dict[str, int] = {}
+        for sport in SPORTS:
+            try:
+                start_years[sport] = max(EARLIEST_YEAR[sport], int(stored.get(sport, EARLIEST_YEAR[sport])))
+            except (TypeError, ValueError):
+                start_years[sport] = EARLIEST_YEAR[sport]
+        return start_years
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        session = requests.Session()
+        session.headers.update({"User-Agent": FETCH_USER_AGENT, "Accept": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=FETCH_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+        return session
+
+    @staticmethod
+    def _fetch_ranking_payload(session: requests.Session, sport: str, year: int) -> dict[str, Any] | None:
+        response = session.get(f"{API_BASE}/{sport}", params={"date": f"{year}-12-31"}, timeout=60)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    @staticmethod
+    def _entries_frame(entries: list[dict[str, Any]], sport: str, year: int, effective_date: str) -> pd.DataFrame:
+        entries_df = pd.json_normalize(entries, max_level=1)
+
+        def column(name: str) -> pd.Series:
+            if name in entries_df.columns:
+                return entries_df[name]
+            return pd.Series(None, index=entries_df.index, dtype=object)
+
+        def or_empty(series: pd.Series) -> pd.Series:
+            return series.where(series.notna() & series.astype(bool), "").astype(str).str.strip()
+
+        country_code = column("team.countryCode")
+        country_code = country_code.where(country_code.notna() & country_code.astype(bool), column("team.abbreviation"))
+        frame = pd.DataFrame(
+            {
+                "sport": sport,
+                "requested_year": year,
+                "effective_date": effective_date,
+                "country_name": or_empty(column("team.name")),
+                "country_code": or_empty(country_code).str.upper(),
+                "source_rank": column("pos"),
+                "points": column("pts"),
+            }
+        )
+        return frame.loc[frame["country_name"] != ""]
+
+    @staticmethod
+    def _unseen_rows(frame: pd.DataFrame, seen: set[tuple[Any, ...]]) -> pd.DataFrame:
+        keys = zip(*(frame[column].tolist() for column in RANKING_KEY_COLUMNS))
+        keep = [key not in seen and not seen.add(key) for key in keys]
+        return frame.loc[keep]
+
+    def _fetch_legacy_csv(self, session: requests.Session) -> tuple[bytes, str]:
+        cache_path = self._local_seed_path().with_name("legacy_men.csv")
+        etag_path = cache_path.with_suffix(".etag")
+        headers: dict[str, str] = {}
+        if cache_path.exists() and etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+
+        response = session.get(LEGACY_MEN_CSV_URL, headers=headers, timeout=90)
+        if response.status_code == 304 and headers:
+            return cache_path.read_bytes(), "hit"
+        response.raise_for_status()
+
+        content = response.content
+        etag = response.headers.get("ETag")
+        safe_mkdir(cache_path.parent)
+        cache_path.write_bytes(content)
+        if etag:
+            etag_path.write_text(etag, encoding="utf-8")
+        else:
+            etag_path.unlink(missing_ok=True)
+        return content, "miss"
+
+    @staticmethod
+    def _read_legacy_csv(content: bytes) -> pd.DataFrame:
+        if pyarrow is not None:
+            try:
+                return pd.read_csv(io.BytesIO(content), engine="pyarrow")
+            except ValueError:
+                pass
+        return pd.read_csv(io.BytesIO(content))
+
     def fetch(self, season_year: int, out_dir: Path) -> list[Path]:
         out_file = out_dir / "world_rugby_rankings_history.csv"
         local_seed = self._local_seed_path()
-        headers = {"User-Agent": "DataSportPipeline/0.1 (World Rugby rankings fetch)", "Accept": "application/json"}
-        rows: list[dict[str, Any]] = []
+        frames: list[pd.DataFrame] = []
+        seen_keys: set[tuple[Any, ...]] = set()
         errors: list[str] = []
         sources: list[str] = []
         request_count = 0
-        try:
-            for sport in SPORTS:
-                for year in range(DEFAULT_START_YEAR, season_year + 1):
+        legacy_cache = None
+        start_years = self._start_years()
+        first_data_years: dict[str, int] = {}
+        jobs = [(sport, year) for sport in SPORTS for year in range(start_years[sport], season_year + 1)]
+        with self._build_session() as session, ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            # The legacy CSV goes first so it downloads while the API sweep is still in flight.
+            legacy_future = executor.submit(self._fetch_legacy_csv, session)
+            api_futures = [executor.submit(self._fetch_ranking_payload, session, sport, year) for sport, year in jobs]
+            try:
+                # Results are consumed in request order so a failure keeps exactly the rows fetched before it.
+                for (sport, year), future in zip(jobs, api_futures):
                     request_count += 1
-                    date_value = f"{year}-12-31"
-                    url = f"{API_BASE}/{sport}"
-                    response = requests.get(url, params={"date": date_value}, headers=headers, timeout=60)
-                    if response.status_code == 404:
+                    payload = future.result()
+                    if payload is None:
                         continue
-                    response.raise_for_status()
-                    payload = response.json()
 
                     effective = payload.get("effective", {})
                     effective_date = str(effective.get("label") or "").strip()
@@ -80,64 +277,53 @@ class WorldRugbyRankingHistoryConnector(Connector):
                     if effective_year > year:
                         continue
 
-                    entries = payload.get("entries", [])
-                    for entry in entries:
-                        team = entry.get("team", {}) or {}
-                        country_name = str(team.get("name") or "").strip()
-                        country_code = str(team.get("countryCode") or team.get("abbreviation") or "").strip().upper()
-                        rank_value = entry.get("pos")
-                        points_value = entry.get("pts")
-                        if not country_name:
-                            continue
-                        rows.append(
-                            {
-                                "sport": sport,
-                                "requested_year": year,
-                                "effective_date": effective_date,
-                                "country_name": country_name,
-                                "country_code": country_code,
-                                "source_rank": rank_value,
-                                "points": points_value,
-                            }
-                        )
-            sources.append(API_BASE)
-        except Exception as exc:
-            errors.append(f"api_fetch_failed: {exc}")
-
-        try:
-            legacy_response = requests.get(LEGACY_MEN_CSV_URL, headers=headers, timeout=90)
-            legacy_response.raise_for_status()
-            legacy_raw = pd.read_csv(io.StringIO(legacy_response.text))
-            normalized_columns = {column: column.strip().lower() for column in legacy_raw.columns}
-            legacy = legacy_raw.rename(columns=normalized_columns)
-            required = {"team", "date", "score"}
-            if required.issubset(set(legacy.columns)):
-                legacy["effective_date"] = pd.to_datetime(legacy["date"], dayfirst=True, errors="coerce")
-                legacy["country_name"] = legacy["team"].astype(str).str.strip()
-                legacy["points"] = pd.to_numeric(legacy["score"], errors="coerce")
-                legacy = legacy.dropna(subset=["effective_date", "country_name", "points"]).copy()
-                legacy["requested_year"] = legacy["effective_date"].dt.year
-                legacy = legacy.loc[legacy["requested_year"] <= season_year].copy()
-                legacy["effective_date"] = legacy["effective_date"].dt.strftime("%Y-%m-%d")
-                legacy = legacy.sort_values(
-                    ["effective_date", "points", "country_name"],
-                    ascending=[True, False, True],
-                )
-                legacy["source_rank"] = legacy.groupby("effective_date").cumcount() + 1
-                legacy["sport"] = "mru"
-                legacy["country_code"] = ""
-                rows.extend(
-                    legacy[
-                        ["sport", "requested_year", "effective_date", "country_name", "country_code", "source_rank", "points"]
-                    ].to_dict(orient="records")
+                    entries_frame = self._entries_frame(payload.get("entries", []), sport, year, effective_date)
+                    entries_frame = self._unseen_rows(entries_frame, seen_keys)
+                    if not entries_frame.empty:
+                        frames.append(entries_frame)
+                        first_data_years.setdefault(sport, year)
+                sources.append(API_BASE)
+                # Leading years that returned nothing are skipped on the next run.
+                self._write_json(
+                    self._fetch_state_path(),
+                    {"earliest_years": {**start_years, **first_data_years}},
                 )
-                sources.append(LEGACY_MEN_CSV_URL)
-            else:
-                errors.append("legacy_csv_format_unsupported")
-        except Exception as exc:
-            errors.append(f"legacy_fetch_failed: {exc}")
-
-        if not rows:
+            except Exception as exc:
+                errors.append(f"api_fetch_failed: {exc}")
+                for future in api_futures:
+                    future.cancel()
+
+            try:
+                legacy_content, legacy_cache = legacy_future.result()
+                legacy_raw = self._read_legacy_csv(legacy_content)
+                normalized_columns = {column: column.strip().lower() for column in legacy_raw.columns}
+                legacy = legacy_raw.rename(columns=normalized_columns)
+                required = {"team", "date", "score"}
+                if required.issubset(set(legacy.columns)):
+                    legacy["effective_date"] = pd.to_datetime(legacy["date"], dayfirst=True, errors="coerce")
+                    legacy["country_name"] = legacy["team"].astype(str).str.strip()
+                    legacy["points"] = pd.to_numeric(legacy["score"], errors="coerce")
+                    legacy = legacy.dropna(subset=["effective_date", "country_name", "points"]).copy()
+                    legacy["requested_year"] = legacy["effective_date"].dt.year
+                    legacy = legacy.loc[legacy["requested_year"] <= season_year].copy()
+                    legacy["effective_date"] = legacy["effective_date"].dt.strftime("%Y-%m-%d")
+                    legacy = legacy.sort_values(
+                        ["effective_date", "points", "country_name"],
+                        ascending=[True, False, True],
+                    )
+                    legacy["source_rank"] = legacy.groupby("effective_date").cumcount() + 1
+                    legacy["sport"] = "mru"
+                    legacy["country_code"] = ""
+                    legacy = self._unseen_rows(legacy, seen_keys)
+                    if not legacy.empty:
+                        frames.append(legacy[RANKING_COLUMNS])
+                    sources.append(LEGACY_MEN_CSV_URL)
+                else:
+                    errors.append("legacy_csv_format_unsupported")
+            except Exception as exc:
+                errors.append(f"legacy_fetch_failed: {exc}")
+
+        if not frames:
             if local_seed.exists():
                 shutil.copy2(local_seed, out_file)
                 self._write_json(
@@ -151,14 +337,16 @@ class WorldRugbyRankingHistoryConnector(Connector):
                 return [out_file]
             raise RuntimeError(f"World Rugby rankings fetch returned no rows. errors={errors}")
 
-        frame = pd.DataFrame(rows).drop_duplicates(
-            subset=["sport", "requested_year", "effective_date", "country_name"],
-            keep="first",
+        frame = pd.concat(frames, ignore_index=True).astype(
+            {"sport": pd.CategoricalDtype(categories=list(SPORTS)), "country_name": TEXT_DTYPE}
         )
-        frame.to_csv(out_file, index=False)
+        if pyarrow_csv is not None:
+            pyarrow_csv.write_csv(pyarrow.Table.from_pandas(frame, preserve_index=False), out_file)
+        else:
+            frame.to_csv(out_file, index=False)
 
         local_seed.parent.mkdir(parents=True, exist_ok=True)
-        frame.to_csv(local_seed, index=False)
+        shutil.copy2(out_file, local_seed)
 
         self._write_json(
             out_dir / "fetch_meta.json",
@@ -168,74 +356,88 @@ class WorldRugbyRankingHistoryConnector(Connector):
                 "requests": request_count,
                 "rows": int(len(frame)),
                 "sports": sorted(SPORTS),
-                "years_requested": {"start": DEFAULT_START_YEAR, "end": season_year},
+                "years_requested": {"start": min(start_years.values()), "end": season_year},
+                "earliest_years": start_years,
+                "legacy_cache": legacy_cache,
                 "errors": errors,
             },
         )
         return [out_file]
 
+    def _resolve_country_code(self, country_name: str, country_code: str, known_codes: frozenset[str]) -> str:
+        return _resolve_country_code_cached(country_name, country_code, known_codes)
+
     @staticmethod
-    def _medal_from_rank(rank: int | float | None) -> str | None:
-        if rank == 1:
-            return "gold"
-        if rank == 2:
-            return "silver"
-        if rank == 3:
-            return "bronze"
-        return None
-
-    def _resolve_country_code(self, country_name: str, country_code: str, known_codes: set[str]) -> str:
-        name_alias_code = COUNTRY_NAME_ALIASES.get(str(country_name or "").strip())
-        if name_alias_code:
-            return name_alias_code
-
-        code = str(country_code or "").strip().upper()
-        if len(code) == 3 and code in known_codes:
-            return code
-
-        alias_code = COUNTRY_ALIASES.get(code)
-        if alias_code:
-            return alias_code
+    def _parse_cache_dir(csv_path: Path, season_year: int) -> Path:
+        digest = hashlib.blake2b(csv_path.read_bytes(), digest_size=8)
+        # Country resolution differs with and without pycountry (and across its data releases).
+        pycountry_version = getattr(pycountry, "__version__", "unknown") if pycountry is not None else "none"
+        digest.update(f":{season_year}:v{PARSE_CACHE_VERSION}:pycountry={pycountry_version}".encode("utf-8"))
+        return PARSE_CACHE_DIR / digest.hexdigest()
 
+    @staticmethod
+    def _load_parse_cache(cache_dir: Path) -> dict[str, pd.DataFrame] | None:
+        if pyarrow_parquet is None:
+            return None
+        table_paths = {name: cache_dir / f"{name}.parquet" for name in PAYLOAD_TABLES}
+        if not all(path.exists() for path in table_paths.values()):
+            return None
         try:
-            import pycountry
+            return {name: pyarrow_parquet.read_table(path).to_pandas() for name, path in table_paths.items()}
+        except (OSError, pyarrow.ArrowException):
+            return None
 
-            country = pycountry.countries.lookup(country_name)
-            candidate = getattr(country, "alpha_3", None)
-            if candidate:
-                return candidate
-        except Exception:
-            pass
-        return code if len(code) == 3 else slugify(country_name)[:3].upper()
+    @staticmethod
+    def _write_parse_cache(cache_dir: Path, payload: dict[str, pd.DataFrame]) -> None:
+        if pyarrow_parquet is None:
+            return
+        safe_mkdir(cache_dir)
+        for name in PAYLOAD_TABLES:
+            table_path = cache_dir / f"{name}.parquet"
+            partial_path = table_path.with_suffix(".parquet.tmp")
+            pyarrow_parquet.write_table(pyarrow.Table.from_pandas(payload[name], preserve_index=False), partial_path)
+            partial_path.replace(table_path)
 
     def parse(self, raw_paths: list[Path], season_year: int) -> dict[str, pd.DataFrame]:
         csv_path = next(path for path in raw_paths if path.name.endswith(".csv"))
-        frame = pd.read_csv(csv_path)
-
-        required_cols = {
-            "sport",
-            "requested_year",
-            "effective_date",
-            "country_name",
-            "country_code",
-            "source_rank",
-            "points",
-        }
-        if not required_cols.issubset(set(frame.columns)):
-            raise RuntimeError(f"Unsupported World Rugby CSV format with columns: {list(frame.columns)}")
+        cache_dir = self._parse_cache_dir(csv_path, season_year)
+        payload = self._load_parse_cache(cache_dir)
+        if payload is None:
+            payload = self._parse_rankings(csv_path, season_year)
+            self._write_parse_cache(cache_dir, payload)
+        else:
+            # The cached tables carry the first run's insertion time; stamp them like a fresh parse would.
+            timestamp = utc_now_iso()
+            for frame in payload.values():
+                if "created_at_utc" in frame.columns:
+                    frame["created_at_utc"] = timestamp
+        return payload
+
+    def _parse_rankings(self, csv_path: Path, season_year: int) -> dict[str, pd.DataFrame]:
+        columns = list(pd.read_csv(csv_path, nrows=0).columns)
+        if not set(RANKING_COLUMNS).issubset(columns):
+            raise RuntimeError(f"Unsupported World Rugby CSV format with columns: {columns}")
+
+        frame = pd.read_csv(
+            csv_path,
+            usecols=RANKING_COLUMNS,
+            dtype={"sport": "category", "country_name": TEXT_DTYPE, "country_code": TEXT_DTYPE},
+            parse_dates=["effective_date"],
+            date_format="%Y-%m-%d",
+        )
 
-        frame["requested_year"] = pd.to_numeric(frame["requested_year"], errors="coerce")
-        frame["source_rank"] = pd.to_numeric(frame["source_rank"], errors="coerce")
-        frame["points"] = pd.to_numeric(frame["points"], errors="coerce")
-        frame["effective_date"] = pd.to_datetime(frame["effective_date"], errors="coerce")
+        # The C parser already types clean files; only columns holding stray values need the coercing pass.
+        for column in ("requested_year", "source_rank", "points"):
+            if not pd.api.types.is_numeric_dtype(frame[column]):
+                frame[column] = pd.to_numeric(frame[column], errors="coerce")
+        if not pd.api.types.is_datetime64_any_dtype(frame["effective_date"]):
+            frame["effective_date"] = pd.to_datetime(frame["effective_date"], errors="coerce")
         frame = frame.dropna(subset=["sport", "requested_year", "effective_date", "country_name"])
         frame = frame.loc[frame["requested_year"] <= season_year].copy()
         frame["requested_year"] = frame["requested_year"].astype(int)
 
-        selected_dates = frame.groupby(["sport", "requested_year"], as_index=False)["effective_date"].max()
-        selected_dates = selected_dates.rename(columns={"effective_date": "selected_effective_date"})
-        annual = frame.merge(selected_dates, on=["sport", "requested_year"], how="inner")
-        annual = annual.loc[annual["effective_date"] == annual["selected_effective_date"]].copy()
+        selected_effective_date = frame.groupby(["sport", "requested_year"])["effective_date"].transform("max")
+        annual = frame.loc[frame["effective_date"].eq(selected_effective_date)]
         annual = annual.sort_values(
             ["sport", "requested_year", "source_rank", "points", "country_name"],
             ascending=[True, True, True, False, True],
@@ -247,7 +449,7 @@ class WorldRugbyRankingHistoryConnector(Connector):
             raise RuntimeError("World Rugby ranking annual top 10 generation returned zero rows.")
 
         timestamp = utc_now_iso()
-        sport_id = slugify("Rugby")
+        sport_id = SPORT_ID
 
         sports_df = pd.DataFrame(
             [
@@ -260,140 +462,148 @@ class WorldRugbyRankingHistoryConnector(Connector):
             ]
         )
         discipline_row = {
-            "discipline_id": "rugby-union",
+            "discipline_id": DISCIPLINE_ID,
             "discipline_name": "Rugby Union",
-            "discipline_slug": "rugby-union",
+            "discipline_slug": DISCIPLINE_ID,
             "sport_id": sport_id,
             "confidence": 1.0,
             "mapping_source": "connector_world_rugby_ranking_history",
             "created_at_utc": timestamp,
         }
-        discipline_lookup = {sport_code: discipline_row for sport_code in SPORTS}
         disciplines_df = pd.DataFrame([discipline_row])
 
-        known_country_codes: set[str] = set()
         pycountry_by_iso3: dict[str, Any] = {}
-        try:
-            import pycountry
-
-            known_country_codes = {country.alpha_3 for country in pycountry.countries if hasattr(country, "alpha_3")}
+        if pycountry is not None:
             pycountry_by_iso3 = {
                 country.alpha_3: country for country in pycountry.countries if hasattr(country, "alpha_3")
             }
-        except Exception:
-            pass
+        known_country_codes = frozenset(pycountry_by_iso3)
+
+        display_names = annual["country_name"].astype(str).str.strip()
+        # Missing codes stringify to "nan", matching the former per-row str(value or "") conversion.
+        source_codes = annual["country_code"].astype(object).fillna("nan").astype(str).str.strip().str.upper()
+        country_ids = (
+            display_names.map(COUNTRY_NAME_ALIASES)
+            .fillna(source_codes.where(source_codes.str.len().eq(3) & source_codes.isin(known_country_codes)))
+            .fillna(source_codes.map(COUNTRY_ALIASES))
+        )
+        unresolved = country_ids.isna()
+        if unresolved.any():
+            residual_pairs = list(zip(display_names[unresolved], source_codes[unresolved]))
+            residual_codes = {
+                pair: self._resolve_country_code(pair[0], pair[1], known_country_codes) for pair in set(residual_pairs)
+            }
+            country_ids = country_ids.fillna(
+                pd.Series([residual_codes[pair] for pair in residual_pairs], index=country_ids.index[unresolved])
+            )
+        annual = annual.assign(display_name=display_names, country_id=country_ids)
+
+        genders = annual["sport"].astype(str).map({sport_code: meta["gender"] for sport_code, meta in SPORTS.items()})
+        annual = annual.loc[genders.notna()]
+        genders = genders.loc[annual.index]
+        competition_ids = "world_rugby_" + genders + "_ranking"
+        # ``annual`` is already ordered by sport, year and ranking, so ranks are the running count per release.
+        annual = annual.assign(
+            competition_id=competition_ids,
+            event_id=competition_ids + "_" + annual["requested_year"].astype(str).str[-2:],
+            gender=genders,
+            rank=annual.groupby(["sport", "requested_year"], observed=True).cumcount() + 1,
+        )
 
         competitions_rows: list[dict[str, Any]] = []
-        events_rows: list[dict[str, Any]] = []
-        participants_rows: dict[str, dict[str, Any]] = {}
-        results_rows: list[dict[str, Any]] = []
-        countries_rows: dict[str, dict[str, Any]] = {}
-
         for sport_code, meta in SPORTS.items():
-            subset = annual.loc[annual["sport"] == sport_code].copy()
-            if subset.empty:
+            sport_dates = annual.loc[annual["sport"] == sport_code, "effective_date"]
+            if sport_dates.empty:
                 continue
-
-            competition_id = f"world_rugby_{meta['gender']}_ranking"
-            min_date = subset["effective_date"].min().strftime("%Y-%m-%d")
-            max_date = subset["effective_date"].max().strftime("%Y-%m-%d")
             competitions_rows.append(
                 {
-                    "competition_id": competition_id,
+                    "competition_id": f"world_rugby_{meta['gender']}_ranking",
                     "sport_id": sport_id,
                     "name": meta["label"],
                     "season_year": None,
                     "level": "national_team_ranking",
-                    "start_date": min_date,
-                    "end_date": max_date,
+                    "start_date": sport_dates.min().strftime("%Y-%m-%d"),
+                    "end_date": sport_dates.max().strftime("%Y-%m-%d"),
                     "source_id": self.id,
                 }
             )
 
-            for ranking_year, group in subset.groupby("requested_year", sort=True):
-                rank_date = group["effective_date"].max()
-                date_text = rank_date.strftime("%Y-%m-%d")
-                event_id = f"world_rugby_{meta['gender']}_ranking_{str(int(ranking_year))[-2:]}"
-
-                events_rows.append(
-                    {
-                        "event_id": event_id,
-                        "competition_id": competition_id,
-                        "discipline_id": discipline_lookup[sport_code]["discipline_id"],
-                        "gender": meta["gender"],
-                        "event_class": "ranking_release_top10",
-                        "event_date": date_text,
-                    }
-                )
+        releases = annual.drop_duplicates(subset=["sport", "requested_year"])
+        events_df = pd.DataFrame(
+            {
+                "event_id": releases["event_id"],
+                "competition_id": releases["competition_id"],
+                "discipline_id": DISCIPLINE_ID,
+                "gender": releases["gender"],
+                "event_class": "ranking_release_top10",
+                "event_date": releases["effective_date"].dt.strftime("%Y-%m-%d"),
+            }
+        )
+        results_df = pd.DataFrame(
+            {
+                "event_id": annual["event_id"],
+                "participant_id": annual["country_id"],
+                "rank": annual["rank"],
+                "medal": annual["rank"].map(RANK_TO_MEDAL),
+                "score_raw": annual["points"].map("world_rugby_points={}".format),
+                "points_awarded": annual["points"].astype(float),
+            }
+        )
 
-                sorted_group = group.sort_values(
-                    ["source_rank", "points", "country_name"],
-                    ascending=[True, False, True],
-                    na_position="last",
-                ).reset_index(drop=True)
-                top10 = sorted_group.head(10).copy()
-                for position, row in enumerate(top10.itertuples(index=False), start=1):
-                    country_name = str(getattr(row, "country_name", "") or "").strip()
-                    source_code = str(getattr(row, "country_code", "") or "").strip().upper()
-                    country_id = self._resolve_country_code(country_name, source_code, known_country_codes)
-                    participant_id = country_id
-                    participants_rows[participant_id] = {
-                        "participant_id": participant_id,
-                        "type": "team",
-                        "display_name": country_name,
-                        "country_id": country_id,
-                    }
-
-                    if country_id not in countries_rows:
-                        known_country = pycountry_by_iso3.get(country_id)
-                        if known_country:
-                            iso2 = getattr(known_country, "alpha_2", None)
-                            iso3 = getattr(known_country, "alpha_3", country_id)
-                            country_label = getattr(known_country, "name", country_name)
-                        else:
-                            iso2 = None
-                            iso3 = country_id
-                            country_label = country_name
-                        countries_rows[country_id] = {
-                            "country_id": country_id,
-                            "iso2": iso2,
-                            "iso3": iso3,
-                            "name_en": country_label,
-                            "name_fr": None,
-                        }
-
-                    points = getattr(row, "points", None)
-                    results_rows.append(
-                        {
-                            "event_id": event_id,
-                            "participant_id": participant_id,
-                            "rank": position,
-                            "medal": self._medal_from_rank(position),
-                            "score_raw": f"world_rugby_points={points}",
-                            "points_awarded": float(points) if pd.notna(points) else None,
-                        }
-                    )
+        # Participants keep their first-seen order but the latest display name, as the former keyed dict did.
+        participants_rows: list[tuple[str, str, str, str]] = []
+        participant_positions: dict[str, int] = {}
+        countries_rows: list[tuple[str, str | None, str, str, None]] = []
+        seen_countries: set[str] = set()
+        for country_id, country_name in zip(annual["country_id"], annual["display_name"]):
+            participant_id = country_id
+            participant_row = (participant_id, "team", country_name, country_id)
+            position = participant_positions.get(participant_id)
+            if position is None:
+                participant_positions[participant_id] = len(participants_rows)
+                participants_rows.append(participant_row)
+            else:
+                participants_rows[position] = participant_row
+
+            if country_id not in seen_countries:
+                seen_countries.add(country_id)
+                known_country = pycountry_by_iso3.get(country_id)
+                if known_country:
+                    iso2 = getattr(known_country, "alpha_2", None)
+                    iso3 = getattr(known_country, "alpha_3", country_id)
+                    country_label = getattr(known_country, "name", country_name)
+                else:
+                    iso2 = None
+                    iso3 = country_id
+                    country_label = country_name
+                countries_rows.append((country_id, iso2, iso3, country_label, None))
 
         payload = {
-            "countries": pd.DataFrame(countries_rows.values()).drop_duplicates(subset=["country_id"]),
+            "countries": pd.DataFrame.from_records(countries_rows, columns=COUNTRY_COLUMNS),
             "sports": sports_df,
             "disciplines": disciplines_df,
-            "competitions": pd.DataFrame(competitions_rows).drop_duplicates(subset=["competition_id"]),
-            "events": pd.DataFrame(events_rows).drop_duplicates(subset=["event_id"]),
-            "participants": pd.DataFrame(participants_rows.values()).drop_duplicates(subset=["participant_id"]),
-            "results": pd.DataFrame(results_rows).drop_duplicates(subset=["event_id", "participant_id"]),
+            "competitions": pd.DataFrame(competitions_rows).drop_duplicates(
+                subset=["competition_id"], ignore_index=True
+            ),
+            "events": events_df.drop_duplicates(subset=["event_id"], ignore_index=True),
+            "participants": pd.DataFrame.from_records(participants_rows, columns=PARTICIPANT_COLUMNS),
+            "results": results_df.drop_duplicates(
+                subset=["event_id", "participant_id"], ignore_index=True
+            ),
             "sport_federations": pd.DataFrame(),
         }
         return payload
 
     def upsert(self, db: SQLiteDB, payload: dict[str, pd.DataFrame]) -> None:
-        with db.connect() as conn:
+        with db.transaction() as conn:
+            # Each subquery is a single indexed join (idx_competitions_source, idx_events_competition) evaluated once.
             conn.execute(
                 """
                 DELETE FROM results
-                WHERE event_id IN (
-                    SELECT e.event_id
-                    FROM events e
+                WHERE rowid IN (
+                    SELECT r.rowid
+                    FROM results r
+                    JOIN events e ON e.event_id = r.event_id
                     JOIN competitions c ON c.competition_id = e.competition_id
                     WHERE c.source_id = ?
                 )
@@ -403,23 +613,30 @@ class WorldRugbyRankingHistoryConnector(Connector):
             conn.execute(
                 """
                 DELETE FROM events
-                WHERE competition_id IN (
-                    SELECT competition_id FROM competitions WHERE source_id = ?
+                WHERE rowid IN (
+                    SELECT e.rowid
+                    FROM events e
+                    JOIN competitions c ON c.competition_id = e.competition_id
+                    WHERE c.source_id = ?
                 )
                 """,
                 (self.id,),
             )
             conn.execute("DELETE FROM competitions WHERE source_id = ?", (self.id,))
-            conn.commit()
-
-        db.upsert_dataframe("countries", payload.get("countries", pd.DataFrame()), ["country_id"])
-        db.upsert_dataframe("sports", payload.get("sports", pd.DataFrame()), ["sport_id"])
-        db.upsert_dataframe("disciplines", payload.get("disciplines", pd.DataFrame()), ["discipline_id"])
-        db.upsert_dataframe("competitions", payload.get("competitions", pd.DataFrame()), ["competition_id"])
-        db.upsert_dataframe("events", payload.get("events", pd.DataFrame()), ["event_id"])
-        db.upsert_dataframe("participants", payload.get("participants", pd.DataFrame()), ["participant_id"])
-        db.upsert_dataframe("results", payload.get("results", pd.DataFrame()), ["event_id", "participant_id"])
-        with db.connect() as conn:
+
+            db.upsert_dataframe("countries", payload.get("countries", pd.DataFrame()), ["country_id"], conn=conn)
+            db.upsert_dataframe("sports", payload.get("sports", pd.DataFrame()), ["sport_id"], conn=conn)
+            db.upsert_dataframe("disciplines", payload.get("disciplines", pd.DataFrame()), ["discipline_id"], conn=conn)
+            db.upsert_dataframe(
+                "competitions", payload.get("competitions", pd.DataFrame()), ["competition_id"], conn=conn
+            )
+            db.upsert_dataframe("events", payload.get("events", pd.DataFrame()), ["event_id"], conn=conn)
+            db.upsert_dataframe(
+                "participants", payload.get("participants", pd.DataFrame()), ["participant_id"], conn=conn
+            )
+            db.upsert_dataframe(
+                "results", payload.get("results", pd.DataFrame()), ["event_id", "participant_id"], conn=conn
+            )
             conn.execute(
                 """
                 DELETE FROM countries
@@ -431,4 +648,3 @@ class WorldRugbyRankingHistoryConnector(Connector):
                   )
                 """
             )
-            conn.commit()
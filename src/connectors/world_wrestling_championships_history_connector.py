@@ -7,7 +7,7 @@ from typing import Any
 import pandas as pd
 
 from src.core.db import SQLiteDB
-from src.core.utils import slugify, utc_now_iso
+from src.core.utils import slugify, slugify_series, utc_now_iso
 
 from .base import Connector
 
@@ -234,7 +234,7 @@ class WorldWrestlingChampionshipsHistoryConnector(Connector):
             .sort_values(["discipline_key"])
             .rename(columns={"discipline_key": "discipline_id"})
         )
-        disciplines_df["discipline_slug"] = disciplines_df["discipline_name"].map(slugify)
+        disciplines_df["discipline_slug"] = slugify_series(disciplines_df["discipline_name"])
         disciplines_df["sport_id"] = "wrestling"
         disciplines_df["confidence"] = 1.0
         disciplines_df["mapping_source"] = "connector_world_wrestling_championships_history"
@@ -55,6 +55,18 @@ HEURISTIC_RULES: list[tuple[re.Pattern[str], str, float]] = [
     (re.compile(r"\b(sabre|foil|epee)\b", re.I), "Fencing", 0.85),
 ]
 
+# All rules in one anchored pattern: alternatives are tried in list order and each lookahead scans the whole entry,
+# so the first matching rule still wins even when a later rule matches earlier in the string.
+HEURISTIC_PATTERN = re.compile(
+    "|".join(
+        rf"(?=.*?(?:{pattern.pattern}))(?P<rule{index}>)" for index, (pattern, _, _) in enumerate(HEURISTIC_RULES)
+    ),
+    re.I | re.S,
+)
+HEURISTIC_RULE_BY_GROUP = {
+    f"rule{index}": (sport_name, confidence) for index, (_, sport_name, confidence) in enumerate(HEURISTIC_RULES)
+}
+
 
 def load_seed_entries(seed_path: Path) -> list[str]:
     entries: list[str] = []
@@ -152,9 +164,10 @@ def _infer_mapping(entry: str, explicit_sports: set[str], overrides: dict[str, s
         sport_title = " ".join(token.capitalize() for token in normalized.split())
         return "sport", sport_title, 1.00, "exact_sport"
 
-    for pattern, sport_name, confidence in HEURISTIC_RULES:
-        if pattern.search(entry):
-            return "discipline", sport_name, confidence, "heuristic_regex"
+    heuristic_match = HEURISTIC_PATTERN.match(entry)
+    if heuristic_match:
+        sport_name, confidence = HEURISTIC_RULE_BY_GROUP[heuristic_match.lastgroup]
+        return "discipline", sport_name, confidence, "heuristic_regex"
 
     tokens = normalized.split()
     for token in tokens:
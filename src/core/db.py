@@ -1,110 +1,292 @@
 from __future__ import annotations
 
+import csv
+import hashlib
 import sqlite3
-import uuid
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Mapping
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, NamedTuple, Sequence
 
 from .schema import SCHEMA_SQL
 from .utils import safe_mkdir
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+STATEMENT_CACHE_SIZE = 1024
+# page_size only applies to a new, empty file and is frozen once it switches to WAL, so it has to run first.
+CONNECTION_PRAGMAS = (
+    "PRAGMA page_size = 8192;",
+    "PRAGMA foreign_keys = ON;",
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -65536;",
+    "PRAGMA mmap_size = 268435456;",
+    "PRAGMA busy_timeout = 5000;",
+    "PRAGMA journal_size_limit = 67108864;",
+)
+# mode=ro connections cannot change the file (page size, journal mode), so they only get the per-connection settings.
+READ_ONLY_PRAGMAS = (
+    "PRAGMA foreign_keys = ON;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -65536;",
+    "PRAGMA mmap_size = 268435456;",
+    "PRAGMA busy_timeout = 5000;",
+)
+ALLOWED_TABLES = (
+    "countries",
+    "sports",
+    "disciplines",
+    "competitions",
+    "events",
+    "participants",
+    "results",
+    "sources",
+    "raw_imports",
+    "sport_federations",
+)
+# Built once so every call hands sqlite3 the same SQL text and hits its prepared-statement cache.
+SELECT_ALL = {table: f"SELECT * FROM {table}" for table in ALLOWED_TABLES}
+TABLE_INFO = {table: f"PRAGMA table_info({table})" for table in ALLOWED_TABLES}
+ROW_COUNTS_SQL = " UNION ALL ".join(f"SELECT '{table}', COUNT(*) FROM {table}" for table in ALLOWED_TABLES)
+
+
+# Fixed positional layouts for the bookkeeping rows: the tuples go to executemany as-is, with no per-key lookups.
+class SourceRow(NamedTuple):
+    source_id: str
+    source_name: str
+    source_type: str | None
+    license_notes: str | None
+    base_url: str | None
+
+
+class RawImportRow(NamedTuple):
+    import_id: str
+    source_id: str
+    fetched_at_utc: str
+    raw_path: str
+    status: str
+    error: str | None
+
+
+def _table_sql(statements: Mapping[str, str], table: str) -> str:
+    try:
+        return statements[table]
+    except KeyError:
+        raise ValueError(f"Unknown table {table!r}; expected one of {ALLOWED_TABLES}") from None
+
+
+def _sql_values(rows: Iterable[Iterable[object]]) -> Iterator[tuple]:
+    # pandas/numpy are only needed once there is data to write; read-only callers never pay for the import.
+    import numpy as np
+    import pandas as pd
+
+    def _sql_value(value: object) -> object:
+        if value is None or value is pd.NA or value != value:
+            return None
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    for row in rows:
+        yield tuple(_sql_value(value) for value in row)
+
+
+def _sql_rows(df: pd.DataFrame) -> Iterator[tuple]:
+    import pandas as pd
+
+    datetime_columns = {
+        column: df[column].dt.strftime("%Y-%m-%d %H:%M:%S")
+        for column in df.columns
+        if pd.api.types.is_datetime64_any_dtype(df[column])
+    }
+    frame = df.assign(**datetime_columns) if datetime_columns else df
+    # Rows are converted one at a time as executemany pulls them, so no cleaned copy of the frame is built.
+    yield from _sql_values(frame.itertuples(index=False, name=None))
+
+
+@lru_cache(maxsize=8)
+def _schema_version(schema_sql: str) -> int:
+    # user_version is a signed 32-bit header field; 0 is what every new file starts with, so it is never used.
+    digest = hashlib.blake2b(schema_sql.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "big", signed=True) or 1
+
+
+@lru_cache(maxsize=256)
+def _upsert_sql(table: str, columns: tuple[str, ...], pk_cols: tuple[str, ...]) -> str:
+    update_cols = [column for column in columns if column not in pk_cols]
+    column_sql = ", ".join(columns)
+    placeholders = ", ".join("?" for _ in columns)
+    sql = f"INSERT INTO {table} ({column_sql}) VALUES ({placeholders})"
+    if pk_cols:
+        conflict_sql = ", ".join(pk_cols)
+        if update_cols:
+            set_sql = ", ".join(f"{col}=excluded.{col}" for col in update_cols)
+            sql += f" ON CONFLICT ({conflict_sql}) DO UPDATE SET {set_sql}"
+        else:
+            sql += f" ON CONFLICT ({conflict_sql}) DO NOTHING"
+    return sql
+
 
 class SQLiteDB:
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, read_only: bool = False):
         self.db_path = db_path
-        safe_mkdir(self.db_path.parent)
+        self.read_only = read_only
+        self._conn: sqlite3.Connection | None = None
+        if not read_only:
+            safe_mkdir(self.db_path.parent)
         self._ensure_connection()
 
-    def _ensure_connection(self) -> None:
-        with self.connect() as conn:
-            conn.execute("PRAGMA foreign_keys = ON;")
+    def _ensure_connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.read_only:
+                # WAL lets any number of these readers run alongside the writer without blocking each other.
+                conn = sqlite3.connect(
+                    f"{self.db_path.absolute().as_uri()}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                    cached_statements=STATEMENT_CACHE_SIZE,
+                )
+                pragmas = READ_ONLY_PRAGMAS
+            else:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+                pragmas = CONNECTION_PRAGMAS
+            for pragma in pragmas:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
 
     def connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        # Shared for the lifetime of this object; ``with db.connect() as conn`` commits or rolls back but never closes.
+        return self._ensure_connection()
 
-    def create_schema(self) -> None:
-        with self.connect() as conn:
-            conn.executescript(SCHEMA_SQL)
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def transaction(self, mode: str = "IMMEDIATE") -> Iterator[sqlite3.Connection]:
+        conn = self.connect()
+        try:
+            conn.execute(f"BEGIN {mode}")
+            yield conn
             conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def create_schema(self) -> None:
+        self.create_schema_sql(SCHEMA_SQL)
 
     def create_schema_sql(self, schema_sql: str) -> None:
-        with self.connect() as conn:
-            conn.executescript(schema_sql)
-            conn.commit()
+        # The file records which script built it, so an up-to-date database skips parsing the whole DDL again.
+        version = _schema_version(schema_sql)
+        conn = self.connect()
+        if conn.execute("PRAGMA user_version").fetchone()[0] == version:
+            return
+        # executescript autocommits each statement; one explicit transaction makes the whole script a single commit.
+        try:
+            conn.executescript(f"BEGIN IMMEDIATE;\n{schema_sql}\nPRAGMA user_version = {version};\nCOMMIT;")
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
 
-    def upsert_dataframe(self, table: str, df: pd.DataFrame, pk_cols: Iterable[str]) -> int:
+    def upsert_dataframe(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        pk_cols: Iterable[str],
+        conn: sqlite3.Connection | None = None,
+    ) -> int:
         if df is None or df.empty:
             return 0
-        pk_cols = list(pk_cols)
-        columns = list(df.columns)
-        update_cols = [column for column in columns if column not in pk_cols]
-        column_sql = ", ".join(columns)
-        staging_table = f"_stg_{table}_{uuid.uuid4().hex[:8]}"
-        clean_df = df.where(pd.notna(df), None)
-        with self.connect() as conn:
-            clean_df.to_sql(staging_table, conn, if_exists="replace", index=False)
-            if pk_cols:
-                where_pk = " AND ".join(f"t.{col}=s.{col}" for col in pk_cols)
-                if update_cols:
-                    set_sql = ", ".join(
-                        f"{col}=(SELECT s.{col} FROM {staging_table} AS s WHERE {where_pk})" for col in update_cols
-                    )
-                    conn.execute(
-                        f"UPDATE {table} AS t SET {set_sql} "
-                        f"WHERE EXISTS (SELECT 1 FROM {staging_table} AS s WHERE {where_pk})"
-                    )
-                conn.execute(
-                    f"INSERT INTO {table} ({column_sql}) "
-                    f"SELECT {column_sql} FROM {staging_table} AS s "
-                    f"WHERE NOT EXISTS (SELECT 1 FROM {table} AS t WHERE {where_pk})"
-                )
-            else:
-                conn.execute(f"INSERT INTO {table} ({column_sql}) SELECT {column_sql} FROM {staging_table}")
-            conn.execute(f"DROP TABLE IF EXISTS {staging_table}")
-            conn.commit()
-        return len(clean_df)
+        if conn is None:
+            with self.transaction() as conn:
+                return self.upsert_dataframe(table, df, pk_cols, conn=conn)
+
+        sql = _upsert_sql(table, tuple(df.columns), tuple(pk_cols))
+        conn.executemany(sql, _sql_rows(df))
+        return len(df)
 
     def insert_dataframe(self, table: str, df: pd.DataFrame) -> int:
         if df is None or df.empty:
             return 0
-        clean_df = df.where(pd.notna(df), None)
-        with self.connect() as conn:
-            clean_df.to_sql(table, conn, if_exists="append", index=False)
-            conn.commit()
-        return len(clean_df)
+        columns = list(df.columns)
+        column_sql = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        with self.transaction() as conn:
+            conn.executemany(f"INSERT INTO {table} ({column_sql}) VALUES ({placeholders})", _sql_rows(df))
+        return len(df)
+
+    def upsert_rows(
+        self,
+        table: str,
+        rows: Sequence[Mapping[str, Any] | NamedTuple],
+        pk_cols: Iterable[str],
+        conn: sqlite3.Connection | None = None,
+    ) -> int:
+        if not rows:
+            return 0
+        if conn is None:
+            with self.transaction() as conn:
+                return self.upsert_rows(table, rows, pk_cols, conn=conn)
+
+        first = rows[0]
+        if isinstance(first, tuple):
+            # NamedTuple rows already carry their column order and plain values: bind them positionally.
+            sql = _upsert_sql(table, first._fields, tuple(pk_cols))
+            conn.executemany(sql, rows)
+            return len(rows)
+        columns = tuple(first)
+        sql = _upsert_sql(table, columns, tuple(pk_cols))
+        conn.executemany(sql, _sql_values(tuple(row.get(column) for column in columns) for row in rows))
+        return len(rows)
+
+    def ensure_source(self, source: SourceRow | Mapping[str, str], conn: sqlite3.Connection | None = None) -> None:
+        self.upsert_rows("sources", [source], ["source_id"], conn=conn)
 
-    def ensure_source(self, source: Mapping[str, str]) -> None:
-        frame = pd.DataFrame([source])
-        self.upsert_dataframe("sources", frame, ["source_id"])
+    def log_raw_import(self, row: RawImportRow | Mapping[str, str], conn: sqlite3.Connection | None = None) -> None:
+        self.log_raw_imports([row], conn=conn)
 
-    def log_raw_import(self, row: Mapping[str, str]) -> None:
-        frame = pd.DataFrame([row])
-        self.upsert_dataframe("raw_imports", frame, ["import_id"])
+    def log_raw_imports(
+        self, rows: Sequence[RawImportRow | Mapping[str, str]], conn: sqlite3.Connection | None = None
+    ) -> int:
+        return self.upsert_rows("raw_imports", rows, ["import_id"], conn=conn)
 
     def read_table(self, table: str) -> pd.DataFrame:
+        import pandas as pd
+
         with self.connect() as conn:
-            return pd.read_sql_query(f"SELECT * FROM {table}", conn)
+            return pd.read_sql_query(_table_sql(SELECT_ALL, table), conn)
+
+    def iter_table(self, table: str, chunksize: int = 50000) -> Iterator[pd.DataFrame]:
+        import pandas as pd
+
+        # One read transaction for the whole scan, so every chunk comes from the same snapshot.
+        with self.transaction("DEFERRED") as conn:
+            yield from pd.read_sql_query(_table_sql(SELECT_ALL, table), conn, chunksize=chunksize)
+
+    def column_types(self, table: str) -> dict[str, str]:
+        rows = self.connect().execute(_table_sql(TABLE_INFO, table)).fetchall()
+        return {row[1]: row[2] for row in rows}
+
+    def stream_table_csv(self, table: str, path: Path | str, chunksize: int = 50000) -> int:
+        row_count = 0
+        with self.transaction("DEFERRED") as conn, open(path, "w", encoding="utf-8", newline="") as handle:
+            cursor = conn.execute(_table_sql(SELECT_ALL, table))
+            writer = csv.writer(handle, lineterminator="\n")
+            writer.writerow([column[0] for column in cursor.description])
+            while rows := cursor.fetchmany(chunksize):
+                writer.writerows(rows)
+                row_count += len(rows)
+        return row_count
 
     def table_row_counts(self) -> dict[str, int]:
-        tables = [
-            "countries",
-            "sports",
-            "disciplines",
-            "competitions",
-            "events",
-            "participants",
-            "results",
-            "sources",
-            "raw_imports",
-            "sport_federations",
-        ]
-        counts: dict[str, int] = {}
-        with self.connect() as conn:
-            for table in tables:
-                cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
-                counts[table] = int(cursor.fetchone()[0])
-        return counts
+        with self.transaction("DEFERRED") as conn:
+            counts = {table: int(count) for table, count in conn.execute(ROW_COUNTS_SQL).fetchall()}
+        return {table: counts[table] for table in ALLOWED_TABLES}
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from .db import SQLiteDB
-from .utils import git_short_hash, safe_mkdir, utc_now_iso
+from .utils import build_timestamp, git_short_hash, json_dumps_bytes, replace_file_bytes, safe_mkdir
 
 
 DATA_DICTIONARY: dict[str, list[tuple[str, str]]] = {
@@ -86,32 +86,56 @@ DATA_DICTIONARY: dict[str, list[tuple[str, str]]] = {
 }
 
 
+DATA_DICTIONARY_HEADERS = {
+    table_name: f"## {table_name}\n\n| column | description |\n|---|---|" for table_name in DATA_DICTIONARY
+}
+
+
+def _read_existing(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _without_timestamp(payload: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in payload.items() if key != "generated_at_utc"}
+
+
 def write_build_meta(db: SQLiteDB, output_path: Path, extra: dict[str, Any] | None = None) -> dict[str, Any]:
     safe_mkdir(output_path.parent)
     payload: dict[str, Any] = {
-        "generated_at_utc": utc_now_iso(),
+        "generated_at_utc": build_timestamp(),
         "git_hash": git_short_hash(),
         "db_path": str(db.db_path),
         "row_counts": db.table_row_counts(),
     }
     if extra:
         payload.update(extra)
-    output_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    existing_text = _read_existing(output_path)
+    if existing_text is not None:
+        try:
+            existing = json.loads(existing_text)
+        except ValueError:
+            existing = None
+        # Same build facts as the file on disk: keep it (and its timestamp) instead of rewriting it.
+        if isinstance(existing, dict) and _without_timestamp(existing) == _without_timestamp(payload):
+            return existing
+    replace_file_bytes(output_path, json_dumps_bytes(payload))
     return payload
 
 
-def write_data_dictionary(output_path: Path) -> None:
-    safe_mkdir(output_path.parent)
-    lines: list[str] = []
-    lines.append("# Data Dictionary")
-    lines.append("")
+def _iter_data_dictionary_lines() -> Iterator[str]:
+    yield "# Data Dictionary"
     for table_name, columns in DATA_DICTIONARY.items():
-        lines.append(f"## {table_name}")
-        lines.append("")
-        lines.append("| column | description |")
-        lines.append("|---|---|")
+        yield ""
+        yield DATA_DICTIONARY_HEADERS[table_name]
         for column_name, description in columns:
-            lines.append(f"| {column_name} | {description} |")
-        lines.append("")
-    output_path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+            yield f"| {column_name} | {description} |"
 
+
+def write_data_dictionary(output_path: Path) -> None:
+    safe_mkdir(output_path.parent)
+    text = "\n".join(_iter_data_dictionary_lines()) + "\n"
+    if _read_existing(output_path) != text:
+        replace_file_bytes(output_path, text.encode("utf-8"))
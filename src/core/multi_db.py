@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import csv
 import json
+import os
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
-import pandas as pd
-
 from .db import SQLiteDB
-from .utils import safe_mkdir, utc_now_iso
+from .schema import COMPETITION_SCHEMA_SQL, LINEAGE_SCHEMA_SQL
+from .utils import build_timestamp, safe_mkdir
+
+
+BASE_FORMATS = ("csv", "sqlite")
+EXPORT_WORKERS = 8
+ARCHITECTURE_CSV_COLUMNS = ["database", "base_path", "table_name", "rows_synced"]
 
 
 @dataclass
@@ -32,44 +39,95 @@ class DatabaseArchitecture:
     def lineage_base(self) -> Path:
         return self.bases_dir / "lineage"
 
+    @property
+    def competition_db(self) -> Path:
+        return self.bases_dir / "competition.db"
+
+    @property
+    def lineage_db(self) -> Path:
+        return self.bases_dir / "lineage.db"
+
 
 def _cleanup_legacy_db_files(architecture: DatabaseArchitecture) -> None:
     for name in ("competition.db", "lineage.db"):
-        legacy_path = architecture.bases_dir / name
-        if legacy_path.exists():
-            legacy_path.unlink()
+        for suffix in ("", "-wal", "-shm"):
+            (architecture.bases_dir / f"{name}{suffix}").unlink(missing_ok=True)
 
 
 def _cleanup_stale_csv_bases(architecture: DatabaseArchitecture, active_bases: set[str]) -> None:
-    for base_dir in architecture.bases_dir.iterdir():
-        if not base_dir.is_dir():
-            continue
-        if base_dir.name not in active_bases:
-            shutil.rmtree(base_dir)
+    with os.scandir(architecture.bases_dir) as entries:
+        for entry in entries:
+            if entry.is_dir() and entry.name not in active_bases:
+                shutil.rmtree(entry.path)
+
+
+def _stream_table_csv_read_only(master_path: Path, table: str, path: str) -> int:
+    reader = SQLiteDB(master_path, read_only=True)
+    try:
+        return reader.stream_table_csv(table, path)
+    finally:
+        reader.close()
+
+
+def _export_tables_to_csv_base(
+    pool: ThreadPoolExecutor,
+    master_path: Path,
+    base_dir: Path,
+    tables: Iterable[str],
+) -> dict[str, Future[int]]:
+    safe_mkdir(base_dir)
+    file_names = {table: f"{table}.csv" for table in tables}
+    expected_files = set(file_names.values())
+    base_dir_str = str(base_dir)
+    with os.scandir(base_dir_str) as entries:
+        for entry in entries:
+            if entry.name.endswith(".csv") and entry.name not in expected_files:
+                os.unlink(entry.path)
+    return {
+        table: pool.submit(_stream_table_csv_read_only, master_path, table, os.path.join(base_dir_str, file_name))
+        for table, file_name in file_names.items()
+    }
 
 
-def _export_tables_to_csv_base(master: SQLiteDB, base_dir: Path, tables: Iterable[str]) -> dict[str, int]:
-    safe_mkdir(base_dir)
-    table_list = list(tables)
-    expected_files = {f"{table}.csv" for table in table_list}
-    for existing_file in base_dir.glob("*.csv"):
-        if existing_file.name not in expected_files:
-            existing_file.unlink()
+def _copy_tables_to_sqlite_base(
+    master: SQLiteDB,
+    base_path: Path,
+    schema_sql: str,
+    tables: Iterable[str],
+) -> dict[str, int]:
+    base = SQLiteDB(base_path)
+    base.create_schema_sql(schema_sql)
+    base.close()
+
     table_counts: dict[str, int] = {}
-    for table in table_list:
-        frame = master.read_table(table)
-        frame.to_csv(base_dir / f"{table}.csv", index=False)
-        table_counts[table] = len(frame)
+    conn = master.connect()
+    conn.execute("ATTACH DATABASE ? AS base", (str(base_path),))
+    try:
+        # Rows stay inside SQLite: one INSERT ... SELECT per table, parents first so base FKs hold.
+        with master.transaction():
+            for table in tables:
+                columns = ", ".join(row[1] for row in conn.execute(f"PRAGMA main.table_info({table})").fetchall())
+                cursor = conn.execute(f"INSERT INTO base.{table} ({columns}) SELECT {columns} FROM main.{table}")
+                table_counts[table] = cursor.rowcount
+    finally:
+        conn.execute("DETACH DATABASE base")
     return table_counts
 
 
-def build_multi_database_architecture(processed_dir: Path, master_db_path: Path | None = None) -> dict[str, object]:
+def build_multi_database_architecture(
+    processed_dir: Path,
+    master_db_path: Path | None = None,
+    base_format: str = "csv",
+) -> dict[str, object]:
+    if base_format not in BASE_FORMATS:
+        raise ValueError(f"Unsupported base format {base_format!r}; expected one of {BASE_FORMATS}")
     processed_dir = processed_dir.resolve()
-    safe_mkdir(processed_dir)
     architecture = DatabaseArchitecture(root_dir=processed_dir)
+    # One makedirs creates processed_dir too; the base directories below are created once each by their exporter.
     safe_mkdir(architecture.bases_dir)
     _cleanup_legacy_db_files(architecture)
-    _cleanup_stale_csv_bases(architecture, active_bases={"competition", "lineage"})
+    active_bases = {"competition", "lineage"} if base_format == "csv" else set()
+    _cleanup_stale_csv_bases(architecture, active_bases=active_bases)
 
     master_path = master_db_path.resolve() if master_db_path else architecture.master_db
     master = SQLiteDB(master_path)
@@ -88,20 +146,43 @@ def build_multi_database_architecture(processed_dir: Path, master_db_path: Path
     ]
     lineage_tables = ["raw_imports"]
 
+    try:
+        if base_format == "sqlite":
+            # A standalone lineage file needs its sources rows for the raw_imports foreign key.
+            lineage_tables = ["sources", *lineage_tables]
+            competition_path = architecture.competition_db
+            lineage_path = architecture.lineage_db
+            competition_counts = _copy_tables_to_sqlite_base(
+                master, competition_path, COMPETITION_SCHEMA_SQL, competition_tables
+            )
+            lineage_counts = _copy_tables_to_sqlite_base(master, lineage_path, LINEAGE_SCHEMA_SQL, lineage_tables)
+        else:
+            competition_path = architecture.competition_base
+            lineage_path = architecture.lineage_base
+            # Every table of both bases streams on its own read-only connection; the tables are independent files.
+            workers = min(EXPORT_WORKERS, len(competition_tables) + len(lineage_tables))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                competition_jobs = _export_tables_to_csv_base(pool, master_path, competition_path, competition_tables)
+                lineage_jobs = _export_tables_to_csv_base(pool, master_path, lineage_path, lineage_tables)
+                competition_counts = {table: job.result() for table, job in competition_jobs.items()}
+                lineage_counts = {table: job.result() for table, job in lineage_jobs.items()}
+    finally:
+        master.close()
+
     payload = {
-        "generated_at_utc": utc_now_iso(),
+        "generated_at_utc": build_timestamp(),
         "master_db": str(master_path),
-        "format": "csv",
+        "format": base_format,
         "databases": {
             "competition": {
-                "path": str(architecture.competition_base),
+                "path": str(competition_path),
                 "tables": competition_tables,
-                "rows_synced": _export_tables_to_csv_base(master, architecture.competition_base, competition_tables),
+                "rows_synced": competition_counts,
             },
             "lineage": {
-                "path": str(architecture.lineage_base),
+                "path": str(lineage_path),
                 "tables": lineage_tables,
-                "rows_synced": _export_tables_to_csv_base(master, architecture.lineage_base, lineage_tables),
+                "rows_synced": lineage_counts,
             },
         },
     }
@@ -123,9 +204,12 @@ def export_architecture_csv(payload: dict[str, object], output_dir: Path) -> Pat
                     "rows_synced": count,
                 }
             )
-    frame = pd.DataFrame(rows).sort_values(["database", "table_name"])
+    rows.sort(key=lambda row: (row["database"], row["table_name"]))
     out_path = output_dir / "database_architecture.csv"
-    frame.to_csv(out_path, index=False)
+    with out_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=ARCHITECTURE_CSV_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
     return out_path
 
 
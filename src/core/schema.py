@@ -100,6 +100,7 @@ CREATE TABLE IF NOT EXISTS sport_federations (
 CREATE INDEX IF NOT EXISTS idx_disciplines_sport ON disciplines(sport_id);
 CREATE INDEX IF NOT EXISTS idx_events_competition ON events(competition_id);
 CREATE INDEX IF NOT EXISTS idx_results_rank ON results(rank);
+CREATE INDEX IF NOT EXISTS idx_results_participant ON results(participant_id);
 CREATE INDEX IF NOT EXISTS idx_competitions_source ON competitions(source_id);
 CREATE INDEX IF NOT EXISTS idx_raw_imports_source ON raw_imports(source_id);
 """
@@ -185,6 +186,14 @@ CREATE TABLE IF NOT EXISTS results (
     FOREIGN KEY (event_id) REFERENCES events(event_id),
     FOREIGN KEY (participant_id) REFERENCES participants(participant_id)
 );
+
+CREATE TABLE IF NOT EXISTS sport_federations (
+    sport_id TEXT NOT NULL,
+    federation_qid TEXT NOT NULL,
+    federation_name TEXT,
+    PRIMARY KEY (sport_id, federation_qid),
+    FOREIGN KEY (sport_id) REFERENCES sports(sport_id)
+);
 """
 
 
@@ -1,44 +1,116 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 import re
 import subprocess
 from datetime import datetime, timezone
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+COMPACT_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%SZ"
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+@cache
+def build_timestamp() -> str:
+    return utc_now_iso()
+
+
 def utc_now_compact() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return datetime.now(timezone.utc).strftime(COMPACT_TIMESTAMP_FORMAT)
+
 
+def iso_from_compact(value: str) -> str:
+    return datetime.strptime(value, COMPACT_TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc).isoformat()
 
+
+@lru_cache(maxsize=4096)
 def slugify(value: str) -> str:
     lowered = value.strip().lower()
     slug = SLUG_PATTERN.sub("-", lowered).strip("-")
     return slug or "unknown"
 
 
+def slugify_series(values: pd.Series) -> pd.Series:
+    slugs = values.str.strip().str.lower().str.replace(SLUG_PATTERN.pattern, "-", regex=True).str.strip("-")
+    slugs = slugs.mask(slugs == "", "unknown")
+    # Backends lowercase a few non-ASCII letters differently from str.lower (e.g. "İ"), so those go through slugify.
+    non_ascii = values.str.contains(r"[^\x00-\x7f]", regex=True).fillna(False).astype(bool)
+    if non_ascii.any():
+        slugs = slugs.mask(non_ascii, values[non_ascii].map(slugify))
+    return slugs
+
+
 def stable_sha1(*parts: object) -> str:
     payload = "|".join(str(part) for part in parts)
     return hashlib.sha1(payload.encode("utf-8")).hexdigest()
 
 
+def stable_blake2b(*parts: object) -> str:
+    payload = "|".join(map(str, parts))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
 def stable_id(prefix: str, *parts: object) -> str:
     return f"{prefix}_{stable_sha1(*parts)}"
 
 
+def stable_id_v2(prefix: str, *parts: object) -> str:
+    return f"{prefix}_{stable_blake2b(*parts)}"
+
+
+def json_dumps_bytes(payload: Any) -> bytes:
+    # Same layout as json.dumps(indent=2, ensure_ascii=False), encoded to UTF-8 by orjson when it is installed.
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def safe_mkdir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
 
 
+def replace_file_bytes(path: Path, data: bytes) -> None:
+    # Readers see either the previous file or the complete new one, never a half-written file.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def fsync_dir(path: Path) -> None:
+    # One sync of the directory persists every rename made in it; platforms without O_DIRECTORY skip it.
+    flags = getattr(os, "O_DIRECTORY", None)
+    if flags is None:
+        return
+    fd = os.open(path, os.O_RDONLY | flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@cache
 def git_short_hash() -> Optional[str]:
     try:
         output = subprocess.check_output(
@@ -1,97 +1,80 @@
 from __future__ import annotations
 
 from pathlib import Path
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from .db import SQLiteDB
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _batch_sql(checks: list[tuple[str, str]]) -> str:
+    # One statement with a scalar subquery per check instead of one round-trip each.
+    return "SELECT " + ", ".join(f"({query})" for _, query in checks)
+
+
+# (check name, child table, parent table) for the declared foreign keys that must always resolve.
+FK_CHECKS: list[tuple[str, str, str]] = [
+    ("disciplines.sport_id exists", "disciplines", "sports"),
+    ("competitions.sport_id exists", "competitions", "sports"),
+    ("events.competition_id exists", "events", "competitions"),
+    ("results.event_id exists", "results", "events"),
+    ("results.participant_id exists", "results", "participants"),
+]
+
+SANITY_CHECKS: list[tuple[str, str]] = [
+    ("results.rank >= 1 or null", "SELECT COUNT(*) FROM results WHERE rank IS NOT NULL AND rank < 1"),
+    (
+        "participants.country_id exists or null",
+        """
+        SELECT COUNT(*)
+        FROM participants p
+        LEFT JOIN countries c ON c.country_id = p.country_id
+        WHERE p.country_id IS NOT NULL AND c.country_id IS NULL
+        """,
+    ),
+]
+
+# Built once so repeated validation runs reuse the same SQL text from sqlite3's statement cache.
+# SQLite's own foreign_key_check walks the parent indexes in C, one violation row per child row and foreign key.
+FK_CHECKS_SQL = " UNION ALL ".join(
+    f"SELECT \"table\", parent, COUNT(*) FROM pragma_foreign_key_check('{table}') GROUP BY parent"
+    for table in dict.fromkeys(table for _, table, _ in FK_CHECKS)
+)
+SANITY_CHECKS_SQL = _batch_sql(SANITY_CHECKS)
+
 
-def _single_count(db: SQLiteDB, query: str) -> int:
+def _run_checks(db: SQLiteDB, checks: list[tuple[str, str]], sql: str) -> list[dict[str, object]]:
     with db.connect() as conn:
-        cursor = conn.execute(query)
-        return int(cursor.fetchone()[0])
+        counts = [int(count) for count in conn.execute(sql).fetchone()]
+    return [
+        {"check": name, "invalid_rows": invalid_rows, "ok": invalid_rows == 0}
+        for (name, _), invalid_rows in zip(checks, counts)
+    ]
 
 
 def run_fk_integrity_checks(db: SQLiteDB) -> list[dict[str, object]]:
-    checks: list[tuple[str, str]] = [
-        (
-            "disciplines.sport_id exists",
-            """
-            SELECT COUNT(*)
-            FROM disciplines d
-            LEFT JOIN sports s ON s.sport_id = d.sport_id
-            WHERE s.sport_id IS NULL
-            """,
-        ),
-        (
-            "competitions.sport_id exists",
-            """
-            SELECT COUNT(*)
-            FROM competitions c
-            LEFT JOIN sports s ON s.sport_id = c.sport_id
-            WHERE s.sport_id IS NULL
-            """,
-        ),
-        (
-            "events.competition_id exists",
-            """
-            SELECT COUNT(*)
-            FROM events e
-            LEFT JOIN competitions c ON c.competition_id = e.competition_id
-            WHERE c.competition_id IS NULL
-            """,
-        ),
-        (
-            "results.event_id exists",
-            """
-            SELECT COUNT(*)
-            FROM results r
-            LEFT JOIN events e ON e.event_id = r.event_id
-            WHERE e.event_id IS NULL
-            """,
-        ),
-        (
-            "results.participant_id exists",
-            """
-            SELECT COUNT(*)
-            FROM results r
-            LEFT JOIN participants p ON p.participant_id = r.participant_id
-            WHERE p.participant_id IS NULL
-            """,
-        ),
-    ]
+    with db.connect() as conn:
+        violations = {(table, parent): int(count) for table, parent, count in conn.execute(FK_CHECKS_SQL)}
     output: list[dict[str, object]] = []
-    for name, query in checks:
-        invalid_rows = _single_count(db, query)
+    for name, table, parent in FK_CHECKS:
+        invalid_rows = violations.get((table, parent), 0)
         output.append({"check": name, "invalid_rows": invalid_rows, "ok": invalid_rows == 0})
     return output
 
 
 def run_sanity_checks(db: SQLiteDB) -> list[dict[str, object]]:
-    checks: list[tuple[str, str]] = [
-        ("results.rank >= 1 or null", "SELECT COUNT(*) FROM results WHERE rank IS NOT NULL AND rank < 1"),
-        (
-            "participants.country_id exists or null",
-            """
-            SELECT COUNT(*)
-            FROM participants p
-            LEFT JOIN countries c ON c.country_id = p.country_id
-            WHERE p.country_id IS NOT NULL AND c.country_id IS NULL
-            """,
-        ),
-    ]
-    output: list[dict[str, object]] = []
-    for name, query in checks:
-        invalid_rows = _single_count(db, query)
-        output.append({"check": name, "invalid_rows": invalid_rows, "ok": invalid_rows == 0})
-    return output
+    return _run_checks(db, SANITY_CHECKS, SANITY_CHECKS_SQL)
 
 
 def run_all_checks(db_path: Path) -> dict[str, object]:
     db = SQLiteDB(db_path)
-    fk_checks = run_fk_integrity_checks(db)
-    sanity_checks = run_sanity_checks(db)
+    try:
+        fk_checks = run_fk_integrity_checks(db)
+        sanity_checks = run_sanity_checks(db)
+    finally:
+        db.close()
     all_checks = fk_checks + sanity_checks
     failed = [check for check in all_checks if not check["ok"]]
     return {
@@ -104,5 +87,7 @@ def run_all_checks(db_path: Path) -> dict[str, object]:
 
 
 def checks_as_frame(check_results: dict[str, object]) -> pd.DataFrame:
+    import pandas as pd
+
     return pd.DataFrame(check_results["checks"])
 
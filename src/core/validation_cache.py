@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from .db import SQLiteDB
+from .utils import replace_file_bytes, safe_mkdir, stable_blake2b
+from .validation import run_all_checks
+
+
+VALIDATION_CACHE_SIZE = 64
+
+
+def validation_signature(db: SQLiteDB) -> str | None:
+    # Fold the WAL back into the main file first so its mtime/size move with every committed write.
+    busy, _, _ = db.connect().execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+    if busy:
+        return None
+    stat = db.db_path.stat()
+    row_counts = db.table_row_counts()
+    return stable_blake2b(
+        db.db_path.resolve(),
+        stat.st_mtime_ns,
+        stat.st_size,
+        *(f"{table}={count}" for table, count in sorted(row_counts.items())),
+    )
+
+
+def _load_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        entries = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def cached_run_all_checks(db: SQLiteDB, cache_path: Path) -> dict[str, object]:
+    signature = validation_signature(db)
+    if signature is None:
+        return run_all_checks(db.db_path)
+
+    entries = _load_cache(cache_path)
+    if entries and next(reversed(entries)) == signature:
+        return entries[signature]
+    report = entries.pop(signature, None)
+    if report is None:
+        report = run_all_checks(db.db_path)
+    # Dict order is the LRU order: hits and new reports move to the end, the oldest entries fall off the front.
+    entries[signature] = report
+    while len(entries) > VALIDATION_CACHE_SIZE:
+        del entries[next(iter(entries))]
+    safe_mkdir(cache_path.parent)
+    replace_file_bytes(cache_path, json.dumps(entries, indent=2, ensure_ascii=False).encode("utf-8"))
+    return report
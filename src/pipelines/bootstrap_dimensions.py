@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import chain
 from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
 
 from src.core.bootstrap import (
     build_countries_dimension,
@@ -9,75 +15,135 @@ from src.core.bootstrap import (
     load_mapping_overrides,
     load_seed_entries,
 )
-from src.core.db import SQLiteDB
+from src.core.db import RawImportRow, SQLiteDB, SourceRow
 from src.core.metadata import write_build_meta, write_data_dictionary
-from src.core.utils import safe_mkdir, stable_id, utc_now_iso
-from src.core.validation import run_all_checks
+from src.core.utils import fsync_dir, safe_mkdir, stable_id_v2, utc_now_iso
+from src.core.validation_cache import cached_run_all_checks
+
+try:
+    import pyarrow
+    import pyarrow.csv as pyarrow_csv
+except ImportError:
+    pyarrow = None
+    pyarrow_csv = None
 
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
+EXPORT_TABLES = ("countries", "sports", "disciplines", "sources", "raw_imports")
+CSV_BUFFER_SIZE = 4 * 1024 * 1024
+# Declared SQLite column types pin one Arrow schema for every chunk; anything else is written as text.
+ARROW_COLUMN_TYPES = {"INTEGER": pyarrow.int64(), "REAL": pyarrow.float64()} if pyarrow is not None else {}
+
+
+def _write_csv(frame: pd.DataFrame, path: Path) -> None:
+    if pyarrow_csv is not None:
+        with pyarrow.output_stream(path, buffer_size=CSV_BUFFER_SIZE) as sink:
+            pyarrow_csv.write_csv(pyarrow.Table.from_pandas(frame, preserve_index=False), sink)
+    else:
+        with open(path, "w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE) as handle:
+            frame.to_csv(handle, index=False)
+
+
+def _write_csv_chunks(
+    first: pd.DataFrame,
+    rest: Iterator[pd.DataFrame],
+    path: Path,
+    column_types: dict[str, str],
+) -> None:
+    if pyarrow_csv is None:
+        with open(path, "w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE) as handle:
+            first.to_csv(handle, index=False)
+            for chunk in rest:
+                chunk.to_csv(handle, header=False, index=False)
+        return
+    schema = pyarrow.schema(
+        [(column, ARROW_COLUMN_TYPES.get(declared, pyarrow.string())) for column, declared in column_types.items()]
+    )
+    with pyarrow.output_stream(path, buffer_size=CSV_BUFFER_SIZE) as sink:
+        with pyarrow_csv.CSVWriter(sink, schema) as writer:
+            for chunk in chain([first], rest):
+                writer.write_table(pyarrow.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _export_table(db_path: Path, table: str, exports_dir: Path) -> None:
+    reader = SQLiteDB(db_path, read_only=True)
+    try:
+        # Only one chunk is held at a time, so peak memory no longer grows with the table.
+        with closing(reader.iter_table(table)) as chunks:
+            rows = (chunk for chunk in chunks if not chunk.empty)
+            first = next(rows, None)
+            if first is not None:
+                _write_csv_chunks(first, rows, exports_dir / f"{table}.csv", reader.column_types(table))
+    finally:
+        reader.close()
 
 
 def _write_exports(db: SQLiteDB, exports_dir: Path) -> None:
     safe_mkdir(exports_dir)
 
-    for table in ("countries", "sports", "disciplines", "sources", "raw_imports"):
-        frame = db.read_table(table)
-        if frame.empty:
-            continue
-        frame.to_csv(exports_dir / f"{table}.csv", index=False)
+    # The tables are independent files: each worker reads through its own read-only connection and writes its CSV.
+    with ThreadPoolExecutor(max_workers=len(EXPORT_TABLES)) as pool:
+        jobs = [pool.submit(_export_table, db.db_path, table, exports_dir) for table in EXPORT_TABLES]
+        for job in jobs:
+            job.result()
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Bootstrap countries/sports/disciplines dimensions.")
-    parser.add_argument("--db-path", default=str(ROOT_DIR / "data/processed/sports_nations.db"))
-    parser.add_argument("--seed-path", default=str(ROOT_DIR / "data/raw/sport_name_seed.txt"))
-    parser.add_argument("--mapping-path", default=str(ROOT_DIR / "data/raw/sport_mapping.yaml"))
-    parser.add_argument("--exports-dir", default=str(ROOT_DIR / "exports/bootstrap_dimensions"))
+    parser.add_argument("--db-path", type=Path, default=ROOT_DIR / "data/processed/sports_nations.db")
+    parser.add_argument("--seed-path", type=Path, default=ROOT_DIR / "data/raw/sport_name_seed.txt")
+    parser.add_argument("--mapping-path", type=Path, default=ROOT_DIR / "data/raw/sport_mapping.yaml")
+    parser.add_argument("--exports-dir", type=Path, default=ROOT_DIR / "exports/bootstrap_dimensions")
     args = parser.parse_args()
 
-    db_path = Path(args.db_path)
-    seed_path = Path(args.seed_path)
-    mapping_path = Path(args.mapping_path)
-    exports_dir = Path(args.exports_dir)
     meta_dir = ROOT_DIR / "meta"
 
-    db = SQLiteDB(db_path)
+    db = SQLiteDB(args.db_path)
     db.create_schema()
 
-    countries_df, countries_note = build_countries_dimension()
-    mapping = load_mapping_overrides(mapping_path)
-    seed_entries = load_seed_entries(seed_path)
+    # Independent loaders (pycountry import, YAML parse, seed read): overlap them instead of running back to back.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        countries_job = pool.submit(build_countries_dimension)
+        mapping_job = pool.submit(load_mapping_overrides, args.mapping_path)
+        seed_job = pool.submit(load_seed_entries, args.seed_path)
+        countries_df, countries_note = countries_job.result()
+        mapping = mapping_job.result()
+        seed_entries = seed_job.result()
     sports_df, disciplines_df, audit_df = build_sports_and_disciplines(seed_entries, mapping)
 
-    db.ensure_source(
-        {
-            "source_id": "local_seed",
-            "source_name": "Local sport_name seed list",
-            "source_type": "seed",
-            "license_notes": "User-provided seed list for normalization bootstrap.",
-            "base_url": str(seed_path),
-        }
-    )
-    db.log_raw_import(
-        {
-            "import_id": stable_id("import", "local_seed", utc_now_iso()),
-            "source_id": "local_seed",
-            "fetched_at_utc": utc_now_iso(),
-            "raw_path": str(seed_path),
-            "status": "success",
-            "error": None,
-        }
-    )
-
-    db.upsert_dataframe("countries", countries_df, ["country_id"])
-    db.upsert_dataframe("sports", sports_df, ["sport_id"])
-    db.upsert_dataframe("disciplines", disciplines_df, ["discipline_id"])
-
-    _write_exports(db, exports_dir)
-    audit_df.to_csv(exports_dir / "discipline_mapping_audit.csv", index=False)
-
-    checks = run_all_checks(db.db_path)
+    imported_at = utc_now_iso()
+    # One write transaction for the whole dimension load: a single commit instead of one per upsert.
+    with db.transaction() as conn:
+        db.ensure_source(
+            SourceRow(
+                source_id="local_seed",
+                source_name="Local sport_name seed list",
+                source_type="seed",
+                license_notes="User-provided seed list for normalization bootstrap.",
+                base_url=str(args.seed_path),
+            ),
+            conn=conn,
+        )
+        db.log_raw_import(
+            RawImportRow(
+                import_id=stable_id_v2("import", "local_seed", imported_at),
+                source_id="local_seed",
+                fetched_at_utc=imported_at,
+                raw_path=str(args.seed_path),
+                status="success",
+                error=None,
+            ),
+            conn=conn,
+        )
+
+        db.upsert_dataframe("countries", countries_df, ["country_id"], conn=conn)
+        db.upsert_dataframe("sports", sports_df, ["sport_id"], conn=conn)
+        db.upsert_dataframe("disciplines", disciplines_df, ["discipline_id"], conn=conn)
+
+    _write_exports(db, args.exports_dir)
+    _write_csv(audit_df, args.exports_dir / "discipline_mapping_audit.csv")
+
+    checks = cached_run_all_checks(db, meta_dir / "validation_cache.json")
     write_build_meta(
         db,
         meta_dir / "build_meta.json",
@@ -88,6 +154,7 @@ def main() -> None:
         },
     )
     write_data_dictionary(meta_dir / "data_dictionary.md")
+    fsync_dir(meta_dir)
 
     print(f"[bootstrap] DB: {db.db_path}")
     print(f"[bootstrap] {countries_note}")
@@ -95,7 +162,7 @@ def main() -> None:
         f"[bootstrap] Inserted/updated dimensions: countries={len(countries_df)} "
         f"sports={len(sports_df)} disciplines={len(disciplines_df)}"
     )
-    print(f"[bootstrap] Audit: {exports_dir / 'discipline_mapping_audit.csv'}")
+    print(f"[bootstrap] Audit: {args.exports_dir / 'discipline_mapping_audit.csv'}")
     print(f"[bootstrap] Validation passed: {checks['passed']}")
 
 
@@ -5,10 +5,10 @@ from pathlib import Path
 
 from src.connectors.base import MissingCredentialError
 from src.connectors.registry import build_connector
-from src.core.db import SQLiteDB
+from src.core.db import RawImportRow, SQLiteDB
 from src.core.metadata import write_build_meta, write_data_dictionary
-from src.core.utils import safe_mkdir, stable_id, utc_now_compact, utc_now_iso
-from src.core.validation import run_all_checks
+from src.core.utils import fsync_dir, iso_from_compact, safe_mkdir, stable_id_v2, utc_now_compact
+from src.core.validation_cache import cached_run_all_checks
 
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
@@ -42,18 +42,18 @@ def main() -> None:
         ),
     )
     parser.add_argument("--year", required=True, type=int)
-    parser.add_argument("--db-path", default=str(ROOT_DIR / "data/processed/sports_nations.db"))
+    parser.add_argument("--db-path", type=Path, default=ROOT_DIR / "data/processed/sports_nations.db")
     args = parser.parse_args()
 
     connector = build_connector(args.connector)
-    db = SQLiteDB(Path(args.db_path))
+    db = SQLiteDB(args.db_path)
     db.create_schema()
     db.ensure_source(connector.source_row())
 
     timestamp = utc_now_compact()
     raw_dir = safe_mkdir(ROOT_DIR / "data" / "raw" / connector.id / timestamp)
     export_dir = safe_mkdir(ROOT_DIR / "exports" / connector.id / f"year={args.year}")
-    import_id = stable_id("import", connector.id, timestamp, args.year)
+    import_id = stable_id_v2("import", connector.id, timestamp, args.year)
     status = "success"
     error_text = None
 
@@ -75,20 +75,21 @@ def main() -> None:
         raise
     finally:
         db.log_raw_import(
-            {
-                "import_id": import_id,
-                "source_id": connector.id,
-                "fetched_at_utc": utc_now_iso(),
-                "raw_path": str(raw_dir),
-                "status": status,
-                "error": error_text,
-            }
+            RawImportRow(
+                import_id=import_id,
+                source_id=connector.id,
+                fetched_at_utc=iso_from_compact(timestamp),
+                raw_path=str(raw_dir),
+                status=status,
+                error=error_text,
+            )
         )
 
-    checks = run_all_checks(db.db_path)
+    meta_dir = ROOT_DIR / "meta"
+    checks = cached_run_all_checks(db, meta_dir / "validation_cache.json")
     write_build_meta(
         db,
-        ROOT_DIR / "meta" / "build_meta.json",
+        meta_dir / "build_meta.json",
         extra={
             "pipeline": "ingest",
             "connector": connector.id,
@@ -97,7 +98,8 @@ def main() -> None:
             "validation_passed": checks["passed"],
         },
     )
-    write_data_dictionary(ROOT_DIR / "meta" / "data_dictionary.md")
+    write_data_dictionary(meta_dir / "data_dictionary.md")
+    fsync_dir(meta_dir)
 
     print(f"[ingest] connector={connector.id} year={args.year} status={status}")
     print(f"[ingest] raw snapshots: {raw_dir}")
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import json
+import sys
 from pathlib import Path
 
-from src.core.validation import run_all_checks
+from src.core.db import SQLiteDB
+from src.core.utils import json_dumps_bytes
+from src.core.validation_cache import cached_run_all_checks
 
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
@@ -12,11 +14,15 @@ ROOT_DIR = Path(__file__).resolve().parents[2]
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run FK and sanity checks on SQLite database.")
-    parser.add_argument("--db-path", default=str(ROOT_DIR / "data/processed/sports_nations.db"))
+    parser.add_argument("--db-path", type=Path, default=ROOT_DIR / "data/processed/sports_nations.db")
     args = parser.parse_args()
 
-    report = run_all_checks(Path(args.db_path))
-    print(json.dumps(report, indent=2, ensure_ascii=False))
+    db = SQLiteDB(args.db_path)
+    try:
+        report = cached_run_all_checks(db, ROOT_DIR / "meta" / "validation_cache.json")
+    finally:
+        db.close()
+    sys.stdout.buffer.write(json_dumps_bytes(report) + b"\n")
     if not report["passed"]:
         raise SystemExit(1)
 